@@ -3,10 +3,27 @@ Flask REST API Server for RPG Game
 Provides endpoints for game state management
 """
 
-from flask import Flask, jsonify, request, send_from_directory
-from flask_cors import CORS
+import functools
+import gzip
+import hashlib
+import itertools
+import mimetypes
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+import brotli
+from flask import Flask, Response, abort, request, send_from_directory
+from flask_compress import Compress
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.security import safe_join
 
 from api.game_state import GameManager
+from api.json_provider import JSONResponse, ORJSONProvider, dumps_bytes
+from generators.vendor import VendorInventory
 from version import VERSION_INFO
 from config import config
 from logging_config import get_logger
@@ -21,735 +38,975 @@ app = Flask(__name__,
 
 # Configure Flask app
 app.config['SECRET_KEY'] = config.SECRET_KEY
+app.config['USE_X_SENDFILE'] = config.USE_X_SENDFILE
+app.json = ORJSONProvider(app)
+
+# Behind a reverse proxy, take the client address and scheme from the
+# X-Forwarded-* headers the trusted proxies set (rate limits are per client IP)
+if config.PROXY_COUNT:
+    app.wsgi_app = ProxyFix(app.wsgi_app,
+                            x_for=config.PROXY_COUNT,
+                            x_proto=config.PROXY_COUNT,
+                            x_host=config.PROXY_COUNT)
+
+# Compress text responses (state JSON is large and repetitive); tile images
+# are already compressed, so they are left out of the mimetype list
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_MIMETYPES'] = [
+    'application/json',
+    'text/html',
+    'text/css',
+    'application/javascript',
+    'text/javascript'
+]
+Compress(app)
+
+# Per-IP rate limits, kept in process memory (the game state is per process
+# anyway). Limits are attached to the API routes when they are registered.
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri='memory://',
+    enabled=config.RATE_LIMIT_ENABLED
+)
+
+# CORS configuration, resolved once at import time
+_CORS_ALLOW_ALL = config.CORS_ORIGINS == '*'
+_CORS_ORIGINS = frozenset() if _CORS_ALLOW_ALL else frozenset(config.cors_origins_list)
+_CORS_METHODS = 'GET, POST, OPTIONS'
+_CORS_HEADERS = 'Content-Type'
+# Browsers may reuse a preflight result this long (most cap it lower)
+CORS_MAX_AGE = 86400
+_PREFLIGHT_HEADERS = {'Access-Control-Max-Age': str(CORS_MAX_AGE)}
+
+# Addresses where the Werkzeug debugger may be enabled
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+# VERSION_INFO never changes at runtime, so serialize it and hash it once
+_VERSION_BODY = dumps_bytes(VERSION_INFO)
+_VERSION_ETAG = hashlib.md5(_VERSION_BODY).hexdigest()
+VERSION_MAX_AGE = 300
+_VERSION_HEADERS = {
+    'ETag': f'"{_VERSION_ETAG}"',
+    'Cache-Control': f'public, max-age={VERSION_MAX_AGE}'
+}
+
+# Serialized bodies of the polled read endpoints, as [state_version, bytes]
+_state_cache = [None, None]
+_combat_status_cache = [None, None]
+
+
+# Serialized hex info bodies for the current state version, as
+# [state_version, OrderedDict((q, r) -> bytes, or None for a miss)], evicted
+# least recently used
+_hex_cache = [None, OrderedDict()]
+HEX_CACHE_SIZE = 4096
+
+# Save directories as used by save_load and generators.character (relative to
+# the working directory), and their serialized listings keyed by directory as
+# (mtime_ns, etag, bytes)
+_SAVES_DIR = 'saves'
+_CHARACTERS_DIR = 'saved_characters'
+_listing_cache = {}
+_listing_generation = itertools.count()
+# A cached listing whose directory mtime matched less than LISTING_TTL
+# seconds ago is served without checking it again
+LISTING_TTL = 1.0
+_listing_checked = {}
+
+# Prefix for state and listing ETags, so tags handed out before a restart
+# (when state_version starts over) never match
+_ETAG_PREFIX = uuid.uuid4().hex[:8]
+
+# Terrenos tile images live in the top-level assets/ directory
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+# Tile images only change between releases
+ASSET_MAX_AGE = 86400
+
+# Compressed copies of static/ text files, keyed by (path, encoding) as
+# (mtime_ns, bytes), so each file is compressed once per change rather than
+# on every request
+_static_cache = {}
+_STATIC_ENCODERS = {
+    'br': lambda data: brotli.compress(data, quality=11),
+    'gzip': lambda data: gzip.compress(data, compresslevel=9)
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_game_manager():
+    """
+    Get the process-wide game manager, creating it on first use.
+
+    Created lazily so a preloading server (gunicorn --preload) builds it in
+    each worker after the fork rather than in the parent process.
+
+    Returns:
+        GameManager: Shared game manager instance
+    """
+    return GameManager()
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response, serializing directly to bytes with orjson.
+
+    Args:
+        payload: JSON-serializable response body
+        status (int): HTTP status code
+
+    Returns:
+        JSONResponse: Response carrying the serialized payload
+    """
+    return JSONResponse.from_payload(payload, status)
+
+
+def _error_body(message):
+    """Serialize {"success": false, "error": message} around a fixed prefix"""
+    return b'{"success":false,"error":' + dumps_bytes(message) + b'}'
+
+
+def error_response(message, status=400):
+    """
+    Build the standard failure response.
+
+    Args:
+        message (str): Error message for the client
+        status (int): HTTP status code
+
+    Returns:
+        JSONResponse: Response carrying the error payload
+    """
+    return JSONResponse(_error_body(message), status=status)
+
+
+def json_body():
+    """
+    Parse the request body as a JSON object.
+
+    The raw bytes go straight to the app's orjson-backed decoder. Missing or
+    malformed bodies, and bodies that aren't a JSON object, parse as {} so
+    handlers can test for their required keys uniformly.
+
+    Returns:
+        dict: Request payload
+    """
+    raw = request.get_data()
+    if not raw:
+        return {}
+    try:
+        data = app.json.loads(raw)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _directory_mtime(directory):
+    """Get a directory's st_mtime_ns, or None if it doesn't exist"""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _current_listing(directory):
+    """Get the cached listing entry for a directory if it is still current, else None"""
+    cached = _listing_cache.get(directory)
+    if cached is None:
+        return None
+    now = time.monotonic()
+    if now - _listing_checked.get(directory, 0.0) < LISTING_TTL:
+        return cached
+    if cached[0] != _directory_mtime(directory):
+        return None
+    _listing_checked[directory] = now
+    return cached
+
+
+def invalidate_listing(directory):
+    """Drop a directory's cached listing after the API writes to it"""
+    _listing_cache.pop(directory, None)
+    _listing_checked.pop(directory, None)
+
+
+def not_modified(etag):
+    """
+    Answer a conditional GET whose cached copy is still current.
+
+    Args:
+        etag (str): Current (weak) entity tag of the resource
+
+    Returns:
+        Response: Empty 304 response if If-None-Match matches, else None
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+    return None
+
+
+def cached_listing_response(directory, build):
+    """
+    Return a directory listing response, rebuilt only when the directory changes.
+
+    The directory's mtime changes whenever a file is added, removed or renamed,
+    and is checked at most once per LISTING_TTL. The save endpoints drop the
+    cached entry for their directory right away.
+
+    Each rebuilt listing gets a new ETag, so clients revalidating an unchanged
+    listing receive a 304.
+
+    Args:
+        directory (str): Directory the listing is read from
+        build (callable): Produces the payload, or its serialized bytes, when
+            the cache is stale
 
-# Enable CORS with configuration
-if config.CORS_ORIGINS == '*':
-    CORS(app)
-else:
-    CORS(app, origins=config.cors_origins_list)
+    Returns:
+        Response: JSONResponse carrying the listing, or an empty 304
+    """
+    cached = _current_listing(directory)
+    if cached is not None:
+        response = not_modified(cached[1])
+        if response is not None:
+            return response
+    else:
+        # mtime is read before building, so a change made meanwhile is
+        # picked up by the next request
+        mtime = _directory_mtime(directory)
+        etag = f'{_ETAG_PREFIX}-{next(_listing_generation)}'
+        cached = (mtime, etag, dumps_bytes(build()))
+        _listing_cache[directory] = cached
+
+    response = JSONResponse(cached[2])
+    response.set_etag(cached[1], weak=True)
+    return response
+
+
+def streamed_listing_response(directory, key, items):
+    """
+    Stream a {"success": true, key: [...]} listing one item at a time.
+
+    Shares the mtime-keyed cache with cached_listing_response: a fresh cache
+    entry is served directly, otherwise items are serialized and sent as they
+    are produced and the complete body is cached once the stream finishes.
+
+    Args:
+        directory (str): Directory the listing is read from
+        key (str): Payload key holding the list
+        items (callable): Returns an iterable of list entries
+
+    Returns:
+        Response: JSONResponse carrying the listing, or an empty 304
+    """
+    cached = _current_listing(directory)
+    if cached is not None:
+        response = not_modified(cached[1])
+        if response is None:
+            response = JSONResponse(cached[2])
+            response.set_etag(cached[1], weak=True)
+        return response
+
+    mtime = _directory_mtime(directory)
+    etag = f'{_ETAG_PREFIX}-{next(_listing_generation)}'
+
+    def generate():
+        chunks = [b'{"success":true,"' + key.encode() + b'":[']
+        yield chunks[0]
+        for i, item in enumerate(items()):
+            chunk = dumps_bytes(item) if i == 0 else b',' + dumps_bytes(item)
+            chunks.append(chunk)
+            yield chunk
+        chunks.append(b']}')
+        yield chunks[-1]
+        _listing_cache[directory] = (mtime, etag, b''.join(chunks))
+
+    response = JSONResponse(generate())
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def prebuilt_error(message, status=400):
+    """
+    Serialize a fixed error payload once, at import time.
+
+    A new Response is still created per call because after_request hooks
+    add headers to it.
+
+    Args:
+        message (str): Error message for the client
+        status (int): HTTP status code
+
+    Returns:
+        callable: Zero-argument factory returning the error Response
+    """
+    body = _error_body(message)
+    return lambda: JSONResponse(body, status=status)
+
+
+def api_endpoint(fn=None, *, read_only=False, locked=True):
+    """
+    Wrap a route handler with the API's shared JSON and error handling.
+
+    The handler returns a payload dict or a ready-made Response (such as
+    error_response(...)). Errors raised by the game logic are mapped to status
+    codes in one place: FileNotFoundError -> 404, ValueError -> 400, anything
+    else -> 500.
+
+    Handlers run while holding the game manager's lock, since the game state
+    is shared by every thread of the server. Unless the handler is marked
+    read_only, the game manager's state_version is bumped before it runs.
+    Handlers that never touch the game state (e.g. save directory listings)
+    pass locked=False so their disk I/O doesn't stall gameplay requests.
+    """
+    if fn is None:
+        return functools.partial(api_endpoint, read_only=read_only, locked=locked)
+
+    # Pick the locking behaviour once, at decoration time
+    if not locked:
+        call = fn
+    elif read_only:
+        def call(*args, **kwargs):
+            with get_game_manager().lock:
+                return fn(*args, **kwargs)
+    else:
+        def call(*args, **kwargs):
+            manager = get_game_manager()
+            with manager.lock:
+                manager.state_version += 1
+                return fn(*args, **kwargs)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            result = call(*args, **kwargs)
+        except FileNotFoundError as e:
+            return error_response(str(e), 404)
+        except ValueError as e:
+            return error_response(str(e), 400)
+        except Exception as e:
+            return error_response(str(e), 500)
+
+        if isinstance(result, Response):
+            return result
+        return json_response(result)
+
+    return wrapper
+
+
+def cached_json_response(cache, build):
+    """
+    Return a JSON response reusing serialized bytes while the state is unchanged.
 
-# Global game manager instance
-game_manager = GameManager()
+    The response carries a weak ETag derived from the state version, and a
+    client that already holds the current version gets an empty 304. The
+    body is sent as one bytes response so the compressor can encode it.
+
+    Args:
+        cache (list): Two-item [state_version, body] list owned by the caller
+        build (callable): Produces the payload, or its serialized bytes, when
+            the cache is stale
+
+    Returns:
+        Response: JSONResponse carrying the payload, or an empty 304
+    """
+    version = get_game_manager().state_version
+    etag = f'{_ETAG_PREFIX}-{version}'
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    if cache[0] != version:
+        payload = build()
+        cache[:] = [version, payload if isinstance(payload, bytes) else dumps_bytes(payload)]
+    response = JSONResponse(cache[1])
+    response.set_etag(etag, weak=True)
+    return response
+
+
+@app.before_request
+def answer_preflight():
+    """Answer CORS preflights with an empty 204 instead of dispatching them"""
+    if (request.method == 'OPTIONS' and request.url_rule is not None
+            and 'Access-Control-Request-Method' in request.headers):
+        return app.response_class(status=204, headers=_PREFLIGHT_HEADERS)
+
+
+@app.after_request
+def add_cors_headers(response):
+    """Attach CORS headers to every response (including OPTIONS preflights)"""
+    headers = response.headers
+    if _CORS_ALLOW_ALL:
+        headers['Access-Control-Allow-Origin'] = '*'
+    else:
+        origin = request.headers.get('Origin')
+        headers.add('Vary', 'Origin')
+        if origin not in _CORS_ORIGINS:
+            return response
+        headers['Access-Control-Allow-Origin'] = origin
+    headers['Access-Control-Allow-Methods'] = _CORS_METHODS
+    headers['Access-Control-Allow-Headers'] = _CORS_HEADERS
+    return response
+
+
+# Validation errors with fixed messages
+_FILENAME_REQUIRED = prebuilt_error("Filename required")
+_QUEST_INDEX_REQUIRED = prebuilt_error("quest_index required")
+_COORDINATES_REQUIRED = prebuilt_error("Coordinates (q, r) required")
+_NAME_REQUIRED = prebuilt_error("Character name required")
+_ITEM_NAME_REQUIRED = prebuilt_error("item_name required")
+_VENDOR_TYPE_REQUIRED = prebuilt_error("vendor_type parameter required")
+_VENDOR_ITEM_REQUIRED = prebuilt_error("vendor_type and item_name required")
+_NO_CHARACTER = prebuilt_error("No character created")
+_NOT_AT_SETTLEMENT = prebuilt_error("Not at a settlement")
+
+# Hex lookups miss often (unexplored coordinates); the coordinates are already
+# in the request URL, so the message doesn't repeat them
+_HEX_NOT_FOUND = prebuilt_error("Hex not found", 404)
+
+# Vendor types keyed by their lowercase form, mapped to the display name used
+# in settlements' available_vendors
+_VENDOR_TITLES = {
+    "armorer": "Armorer",
+    "merchant": "Merchant",
+    "herbalist": "Herbalist",
+}
+
+# Optional create_character fields accepted from the client
+_CHARACTER_FIELDS = frozenset({
+    'race', 'character_type', 'strength', 'dexterity', 'willpower', 'toughness',
+    'special_skill', 'weapon', 'armor', 'shield', 'helmet', 'level', 'xp', 'gold', 'silver'
+})
+
+# Serialized inventory responses keyed by vendor display name; catalogs are
+# static, so only the settlement availability check runs per request
+_vendor_bodies = {}
 
 
 # Serve static files
-@app.route('/')
+def serve_static(filename):
+    """
+    Serve a file from static/, precompressed when the client accepts it.
+
+    Text files (HTML, CSS, JS) are compressed at the highest level once and
+    kept in memory until their mtime changes. Anything else, or a client that
+    accepts neither br nor gzip, goes through send_from_directory.
+    """
+    mimetype = mimetypes.guess_type(filename)[0]
+    encoding = request.accept_encodings.best_match(('br', 'gzip'))
+    if encoding is None or mimetype not in app.config['COMPRESS_MIMETYPES']:
+        return send_from_directory(app.static_folder, filename)
+
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    stat = os.stat(path)
+
+    cached = _static_cache.get((path, encoding))
+    if cached is None or cached[0] != stat.st_mtime_ns:
+        with open(path, 'rb') as f:
+            cached = (stat.st_mtime_ns, _STATIC_ENCODERS[encoding](f.read()))
+        _static_cache[(path, encoding)] = cached
+
+    response = app.response_class(cached[1], mimetype=mimetype)
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(f'{stat.st_mtime_ns}-{stat.st_size}:{encoding}')
+    response.last_modified = stat.st_mtime
+    return response.make_conditional(request)
+
+
 def index():
     """Serve the main HTML file"""
-    return send_from_directory(app.static_folder, 'index.html')
+    return serve_static('index.html')
 
 
-@app.route('/assets/<path:filename>')
 def serve_assets(filename):
     """Serve asset files (Terrenos hex tiles, etc.)"""
-    import os
-    assets_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
-    return send_from_directory(assets_folder, filename)
+    return send_from_directory(_ASSETS_DIR, filename, max_age=ASSET_MAX_AGE)
 
 
 # API Endpoints
 
-@app.route('/api/version', methods=['GET'])
 def get_version():
     """Get game version information"""
-    return jsonify(VERSION_INFO)
+    if request.if_none_match.contains(_VERSION_ETAG):
+        return app.response_class(status=304, headers=_VERSION_HEADERS)
+    return JSONResponse(_VERSION_BODY, headers=_VERSION_HEADERS)
 
 
-@app.route('/api/game/new', methods=['POST'])
+@api_endpoint
 def new_game():
     """Start a new game"""
-    try:
-        state = game_manager.new_game()
-        return jsonify({
-            "success": True,
-            "state": state
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return {"success": True, "state": get_game_manager().new_game()}
 
 
-@app.route('/api/game/state', methods=['GET'])
+@api_endpoint(read_only=True)
 def get_state():
-    """Get current game state"""
-    try:
-        state = game_manager.get_state()
-        return jsonify({
-            "success": True,
-            "state": state
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
+    """
+    Get current game state.
 
-@app.route('/api/game/save', methods=['POST'])
+    With ?since=<revision> (the hex_grid revision of an earlier response), only
+    hexes changed after that revision are included, and a client that is
+    already current gets a short {"unchanged": true} body instead. Revisions
+    from before a server restart get the full state.
+    """
+    since = request.args.get('since')
+    if since is not None:
+        manager = get_game_manager()
+        if since == manager.revision:
+            return {"success": True, "unchanged": True, "revision": since}
+        return {"success": True, "state": manager.get_state(since_revision=since)}
+    return cached_json_response(
+        _state_cache, lambda: b'{"success":true,"state":' + get_game_manager().get_state_bytes() + b'}'
+    )
+
+
+@api_endpoint
 def save_game():
     """Save current game"""
-    try:
-        data = request.get_json() or {}
-        filename = data.get('filename')
-        result = game_manager.save(filename)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/game/load', methods=['POST'])
+    data = json_body()
+    result = get_game_manager().save(data.get('filename'))
+    invalidate_listing(_SAVES_DIR)
+    return result
+
+
+@api_endpoint
 def load_game():
     """Load a saved game"""
-    try:
-        data = request.get_json()
-        if not data or 'filename' not in data:
-            return jsonify({
-                "success": False,
-                "error": "Filename required"
-            }), 400
-
-        result = game_manager.load(data['filename'])
-        return jsonify(result)
-    except FileNotFoundError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 404
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/game/saves', methods=['GET'])
+    data = json_body()
+    if 'filename' not in data:
+        return _FILENAME_REQUIRED()
+
+    return get_game_manager().load(data['filename'])
+
+
+@api_endpoint(read_only=True, locked=False)
 def list_saves():
     """List all available save files"""
-    try:
-        result = game_manager.list_saves()
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return streamed_listing_response(_SAVES_DIR, 'saves', get_game_manager().iter_saves)
 
 
-@app.route('/api/quest/generate', methods=['POST'])
+@api_endpoint
 def generate_quest():
     """Generate a new quest"""
-    try:
-        quest = game_manager.generate_quest()
-        return jsonify({
-            "success": True,
-            "quest": quest
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return {"success": True, "quest": get_game_manager().generate_quest()}
 
 
-@app.route('/api/quest/accept', methods=['POST'])
+@api_endpoint
 def accept_quest():
     """Accept a quest"""
-    try:
-        data = request.get_json()
-        if not data or 'quest_index' not in data:
-            return jsonify({
-                "success": False,
-                "error": "quest_index required"
-            }), 400
-
-        result = game_manager.accept_quest(data['quest_index'])
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/quest/complete', methods=['POST'])
+    data = json_body()
+    if 'quest_index' not in data:
+        return _QUEST_INDEX_REQUIRED()
+
+    return get_game_manager().accept_quest(data['quest_index'])
+
+
+@api_endpoint
 def complete_quest():
     """Complete a quest at destination"""
-    try:
-        data = request.get_json()
-        if not data or 'quest_index' not in data:
-            return jsonify({
-                "success": False,
-                "error": "quest_index required"
-            }), 400
-
-        result = game_manager.complete_quest(data['quest_index'])
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/player/move', methods=['POST'])
+    data = json_body()
+    if 'quest_index' not in data:
+        return _QUEST_INDEX_REQUIRED()
+
+    return get_game_manager().complete_quest(data['quest_index'])
+
+
+@api_endpoint
 def move_player():
     """Move player to a hex"""
-    try:
-        data = request.get_json()
-        if not data or 'q' not in data or 'r' not in data:
-            return jsonify({
-                "success": False,
-                "error": "Coordinates (q, r) required"
-            }), 400
-
-        result = game_manager.move_player(data['q'], data['r'])
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/hex/<int:q>/<int:r>', methods=['GET'])
-def get_hex_info(q, r):
-    """Get information about a specific hex"""
-    try:
-        hex_info = game_manager.get_hex_info(q, r)
-        if hex_info is None:
-            return jsonify({
-                "success": False,
-                "error": f"Hex ({q}, {r}) not found"
-            }), 404
-
-        return jsonify({
-            "success": True,
-            "hex": hex_info
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    data = json_body()
+    if 'q' not in data or 'r' not in data:
+        return _COORDINATES_REQUIRED()
+
+    return get_game_manager().move_player(data['q'], data['r'])
 
 
-@app.route('/api/player/consume_day_ration', methods=['POST'])
+@api_endpoint(read_only=True)
+def get_hex_info(q=None, r=None):
+    """
+    Get information about a specific hex.
+
+    Coordinates come from the path (/api/hex/1/-2) or from the query string
+    (/api/hex?q=1&r=-2). Responses, including misses, are cached per state
+    version.
+    """
+    if q is None:
+        args = request.args
+        if 'q' not in args or 'r' not in args:
+            return _COORDINATES_REQUIRED()
+        q, r = int(args['q']), int(args['r'])
+
+    # The URL identifies the hex, so the state version alone tags its content
+    version = get_game_manager().state_version
+    etag = f'{_ETAG_PREFIX}-{version}'
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    if _hex_cache[0] != version:
+        _hex_cache[:] = [version, OrderedDict()]
+    entries = _hex_cache[1]
+
+    key = (q, r)
+    if key in entries:
+        entries.move_to_end(key)
+        body = entries[key]
+    else:
+        hex_info = get_game_manager().get_hex_info(q, r)
+        body = None if hex_info is None else dumps_bytes({"success": True, "hex": hex_info})
+        entries[key] = body
+        if len(entries) > HEX_CACHE_SIZE:
+            entries.popitem(last=False)
+
+    if body is None:
+        return _HEX_NOT_FOUND()
+
+    response = JSONResponse(body)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+@api_endpoint
 def consume_day_ration():
     """Consume a ration at day's end to heal half HP"""
-    try:
-        result = game_manager.consume_day_ration()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/dungeon/enter', methods=['POST'])
+    return get_game_manager().consume_day_ration()
+
+
+@api_endpoint
 def enter_dungeon():
     """Enter the dungeon at current location"""
-    try:
-        result = game_manager.enter_dungeon()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/dungeon/room', methods=['GET'])
+    return get_game_manager().enter_dungeon()
+
+
+@api_endpoint(read_only=True)
 def get_current_room():
-    """Get current dungeon room information"""
-    try:
-        result = game_manager.get_current_room()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/dungeon/advance', methods=['POST'])
+    """
+    Get current dungeon room information.
+
+    With ?since=<revision> (the revision of an earlier room response), a
+    client whose room is still current gets a short {"unchanged": true} body
+    instead. Looking at a room only moves the revision on when it starts
+    combat or rolls a new room.
+
+    Revisions are per endpoint: a room revision says nothing about the hexes a
+    client holds, so it must not be sent to /game/state?since.
+    """
+    manager = get_game_manager()
+    if request.args.get('since') == manager.revision:
+        return {"success": True, "unchanged": True, "revision": manager.revision}
+    return manager.get_current_room()
+
+
+@api_endpoint
 def advance_room():
     """Advance to next room in dungeon"""
-    try:
-        result = game_manager.advance_dungeon_room()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/dungeon/complete', methods=['POST'])
+    return get_game_manager().advance_dungeon_room()
+
+
+@api_endpoint
 def complete_dungeon():
     """Complete the current dungeon"""
-    try:
-        result = game_manager.complete_dungeon()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/dungeon/treasure/collect', methods=['POST'])
+    return get_game_manager().complete_dungeon()
+
+
+@api_endpoint
 def collect_dungeon_treasure():
     """Collect treasure from dungeon room with optional item replacement"""
-    try:
-        data = request.get_json() or {}
-        item_to_drop = data.get('item_to_drop_name')
-        result = game_manager.collect_treasure_with_replacement(item_to_drop)
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    data = json_body()
+    return get_game_manager().collect_treasure_with_replacement(data.get('item_to_drop_name'))
 
 
 # Character Management Endpoints
 
-@app.route('/api/character/create', methods=['POST'])
+@api_endpoint
 def create_character():
     """Create a custom character with ability scores"""
-    try:
-        data = request.get_json()
-        if not data or 'name' not in data:
-            return jsonify({
-                "success": False,
-                "error": "Character name required"
-            }), 400
-
-        result = game_manager.create_character(
-            name=data['name'],
-            race=data.get('race', 'Human'),
-            character_type=data.get('character_type', 'Adventurer'),
-            strength=data.get('strength', 10),
-            dexterity=data.get('dexterity', 10),
-            willpower=data.get('willpower', 10),
-            toughness=data.get('toughness', 10),
-            special_skill=data.get('special_skill'),
-            weapon=data.get('weapon'),
-            armor=data.get('armor'),
-            shield=data.get('shield'),
-            helmet=data.get('helmet'),
-            level=data.get('level', 1),
-            xp=data.get('xp', 0),
-            gold=data.get('gold', 0),
-            silver=data.get('silver', 0)
-        )
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/character/random', methods=['POST'])
+    data = json_body()
+    if 'name' not in data:
+        return _NAME_REQUIRED()
+
+    # Fields the client leaves out take GameManager.create_character's defaults
+    options = {key: data[key] for key in _CHARACTER_FIELDS.intersection(data)}
+    return get_game_manager().create_character(data['name'], **options)
+
+
+@api_endpoint
 def generate_random_character():
     """Generate a random character"""
-    try:
-        data = request.get_json() or {}
-        name = data.get('name')
-        result = game_manager.generate_random_character(name)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/character/save', methods=['POST'])
+    data = json_body()
+    return get_game_manager().generate_random_character(data.get('name'))
+
+
+@api_endpoint
 def save_character():
     """Save current character to file"""
-    try:
-        data = request.get_json() or {}
-        filename = data.get('filename')
-        result = game_manager.save_character(filename)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/character/load', methods=['POST'])
+    data = json_body()
+    result = get_game_manager().save_character(data.get('filename'))
+    invalidate_listing(_CHARACTERS_DIR)
+    return result
+
+
+@api_endpoint
 def load_character():
     """Load a character from file"""
-    try:
-        data = request.get_json()
-        if not data or 'filename' not in data:
-            return jsonify({
-                "success": False,
-                "error": "Filename required"
-            }), 400
-
-        result = game_manager.load_character(data['filename'])
-        return jsonify(result)
-    except FileNotFoundError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 404
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/character/list', methods=['GET'])
+    data = json_body()
+    if 'filename' not in data:
+        return _FILENAME_REQUIRED()
+
+    return get_game_manager().load_character(data['filename'])
+
+
+@api_endpoint(read_only=True, locked=False)
 def list_characters():
     """List all saved characters"""
-    try:
-        result = game_manager.list_characters()
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return cached_listing_response(_CHARACTERS_DIR, get_game_manager().list_characters)
 
 
 # Combat Endpoints
 
-@app.route('/api/combat/status', methods=['GET'])
+@api_endpoint(read_only=True)
 def get_combat_status():
     """Get current combat status"""
-    try:
-        result = game_manager.get_combat_status()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/combat/attack', methods=['POST'])
+    return cached_json_response(_combat_status_cache, get_game_manager().get_combat_status)
+
+
+@api_endpoint
 def combat_attack():
     """Player attacks in combat"""
-    try:
-        data = request.get_json() or {}
-        target_index = data.get('target_index', 0)
-        result = game_manager.combat_attack(target_index)
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/combat/item', methods=['POST'])
+    data = json_body()
+    return get_game_manager().combat_attack(data.get('target_index', 0))
+
+
+@api_endpoint
 def combat_use_item():
     """Use an item in combat"""
-    try:
-        data = request.get_json()
-        if not data or 'item_name' not in data:
-            return jsonify({
-                "success": False,
-                "error": "item_name required"
-            }), 400
-
-        result = game_manager.combat_use_item(data['item_name'])
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/combat/flee', methods=['POST'])
+    data = json_body()
+    if 'item_name' not in data:
+        return _ITEM_NAME_REQUIRED()
+
+    return get_game_manager().combat_use_item(data['item_name'])
+
+
+@api_endpoint
 def combat_flee():
     """Attempt to flee from combat"""
-    try:
-        result = game_manager.combat_flee()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/player/heal', methods=['POST'])
+    return get_game_manager().combat_flee()
+
+
+@api_endpoint
 def heal_at_settlement():
     """Heal the player at a settlement for gold"""
-    try:
-        result = game_manager.heal_at_settlement()
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return get_game_manager().heal_at_settlement()
 
 
 # Vendor Endpoints
 
-@app.route('/api/vendor/list', methods=['GET'])
+@api_endpoint(read_only=True)
 def get_vendor_inventory():
     """Get inventory for a specific vendor type"""
-    try:
-        from generators.vendor import VendorInventory
-
-        vendor_type = request.args.get('vendor_type')
-        if not vendor_type:
-            return jsonify({
-                "success": False,
-                "error": "vendor_type parameter required"
-            }), 400
-
-        # Validate vendor type
-        vendor_type_title = vendor_type.title()
-        if vendor_type_title not in ["Armorer", "Merchant", "Herbalist"]:
-            return jsonify({
-                "success": False,
-                "error": f"Invalid vendor type: {vendor_type}"
-            }), 400
-
-        # Check if player is at settlement with this vendor
-        if not game_manager.game_state.player:
-            return jsonify({
-                "success": False,
-                "error": "No character created"
-            }), 400
-
-        current_hex = game_manager.game_state.hex_grid.get_current_hex()
-        if not current_hex or not current_hex.is_settlement:
-            return jsonify({
-                "success": False,
-                "error": "Not at a settlement"
-            }), 400
-
-        if vendor_type_title not in current_hex.available_vendors:
-            return jsonify({
-                "success": False,
-                "error": f"{vendor_type_title} is not available in this settlement"
-            }), 400
-
-        # Get vendor inventory
-        inventory = VendorInventory.get_vendor_inventory(vendor_type)
-
-        return jsonify({
+    vendor_type = request.args.get('vendor_type')
+    if not vendor_type:
+        return _VENDOR_TYPE_REQUIRED()
+
+    # Validate vendor type
+    vendor_type_title = _VENDOR_TITLES.get(vendor_type.lower())
+    if vendor_type_title is None:
+        return error_response(f"Invalid vendor type: {vendor_type}")
+
+    # Check if player is at settlement with this vendor
+    if not get_game_manager().game_state.player:
+        return _NO_CHARACTER()
+
+    current_hex = get_game_manager().game_state.hex_grid.get_current_hex()
+    if not current_hex or not current_hex.is_settlement:
+        return _NOT_AT_SETTLEMENT()
+
+    if vendor_type_title not in current_hex.available_vendors:
+        return error_response(f"{vendor_type_title} is not available in this settlement")
+
+    body = _vendor_bodies.get(vendor_type_title)
+    if body is None:
+        body = _vendor_bodies[vendor_type_title] = dumps_bytes({
             "success": True,
             "vendor_type": vendor_type_title,
-            "inventory": inventory
+            "inventory": VendorInventory.get_vendor_inventory(vendor_type)
         })
-
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    return JSONResponse(body)
 
 
-@app.route('/api/vendor/buy', methods=['POST'])
+@api_endpoint
 def purchase_item():
     """Purchase an item from a vendor"""
-    try:
-        data = request.get_json()
-        if not data or 'vendor_type' not in data or 'item_name' not in data:
-            return jsonify({
-                "success": False,
-                "error": "vendor_type and item_name required"
-            }), 400
-
-        vendor_type = data['vendor_type'].title()
-        item_name = data['item_name']
-
-        result = game_manager.purchase_item(vendor_type, item_name)
-        return jsonify(result)
-
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/vendor/sell', methods=['POST'])
+    data = json_body()
+    if 'vendor_type' not in data or 'item_name' not in data:
+        return _VENDOR_ITEM_REQUIRED()
+
+    vendor_type = data['vendor_type']
+    vendor_type_title = _VENDOR_TITLES.get(vendor_type.lower()) or vendor_type.title()
+    return get_game_manager().purchase_item(vendor_type_title, data['item_name'])
+
+
+@api_endpoint
 def sell_item():
     """Sell an item from player inventory"""
-    try:
-        data = request.get_json()
-        if not data or 'item_name' not in data:
-            return jsonify({
-                "success": False,
-                "error": "item_name required"
-            }), 400
-
-        item_name = data['item_name']
-
-        result = game_manager.sell_item(item_name)
-        return jsonify(result)
-
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
-
-
-@app.route('/api/player/use_item', methods=['POST'])
+    data = json_body()
+    if 'item_name' not in data:
+        return _ITEM_NAME_REQUIRED()
+
+    return get_game_manager().sell_item(data['item_name'])
+
+
+@api_endpoint
 def use_consumable():
     """Use a consumable item from inventory"""
-    try:
-        data = request.get_json()
-        if not data or 'item_name' not in data:
-            return jsonify({
-                "success": False,
-                "error": "item_name required"
-            }), 400
-
-        result = game_manager.use_consumable(data['item_name'])
-        return jsonify(result)
-    except ValueError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    data = json_body()
+    if 'item_name' not in data:
+        return _ITEM_NAME_REQUIRED()
+
+    return get_game_manager().use_consumable(data['item_name'])
+
+
+# URL rules, registered in one pass below
+ROUTES = [
+    # Static files
+    ('/', ['GET'], index),
+    ('/assets/<path:filename>', ['GET'], serve_assets),
+
+    # API Endpoints
+    ('/api/version', ['GET'], get_version),
+    ('/api/game/new', ['POST'], new_game),
+    ('/api/game/state', ['GET'], get_state),
+    ('/api/game/save', ['POST'], save_game),
+    ('/api/game/load', ['POST'], load_game),
+    ('/api/game/saves', ['GET'], list_saves),
+    ('/api/quest/generate', ['POST'], generate_quest),
+    ('/api/quest/accept', ['POST'], accept_quest),
+    ('/api/quest/complete', ['POST'], complete_quest),
+    ('/api/player/move', ['POST'], move_player),
+    ('/api/hex', ['GET'], get_hex_info),
+    ('/api/hex/<int(signed=True):q>/<int(signed=True):r>', ['GET'], get_hex_info),
+    ('/api/player/consume_day_ration', ['POST'], consume_day_ration),
+    ('/api/dungeon/enter', ['POST'], enter_dungeon),
+    ('/api/dungeon/room', ['GET'], get_current_room),
+    ('/api/dungeon/advance', ['POST'], advance_room),
+    ('/api/dungeon/complete', ['POST'], complete_dungeon),
+    ('/api/dungeon/treasure/collect', ['POST'], collect_dungeon_treasure),
+
+    # Character Management Endpoints
+    ('/api/character/create', ['POST'], create_character),
+    ('/api/character/random', ['POST'], generate_random_character),
+    ('/api/character/save', ['POST'], save_character),
+    ('/api/character/load', ['POST'], load_character),
+    ('/api/character/list', ['GET'], list_characters),
+
+    # Combat Endpoints
+    ('/api/combat/status', ['GET'], get_combat_status),
+    ('/api/combat/attack', ['POST'], combat_attack),
+    ('/api/combat/item', ['POST'], combat_use_item),
+    ('/api/combat/flee', ['POST'], combat_flee),
+    ('/api/player/heal', ['POST'], heal_at_settlement),
+
+    # Vendor Endpoints
+    ('/api/vendor/list', ['GET'], get_vendor_inventory),
+    ('/api/vendor/buy', ['POST'], purchase_item),
+    ('/api/vendor/sell', ['POST'], sell_item),
+    ('/api/player/use_item', ['POST'], use_consumable),
+]
+
+# Flask registers the static route itself; route it through serve_static
+app.view_functions['static'] = serve_static
+
+
+def register_routes(routes):
+    """
+    Register URL rules in one pass.
+
+    API views get the write rate limit if they accept POST and the read limit
+    otherwise. The same view may appear under several rules, so each is
+    wrapped only once.
+
+    Args:
+        routes (list): (rule, methods, view) tuples
+    """
+    limited_views = {}
+    for rule, methods, view in routes:
+        if rule.startswith('/api/'):
+            if view not in limited_views:
+                limit = config.RATE_LIMIT_WRITE if 'POST' in methods else config.RATE_LIMIT_READ
+                limited_views[view] = limiter.limit(limit)(view)
+            view = limited_views[view]
+        app.add_url_rule(rule, view_func=view, methods=methods)
+
+
+register_routes(ROUTES)
 
 
 # Error handlers
+_NOT_FOUND = prebuilt_error("Not found", 404)
+_INTERNAL_ERROR = prebuilt_error("Internal server error", 500)
+_TOO_MANY_REQUESTS = prebuilt_error("Too many requests", 429)
+
+
 @app.errorhandler(404)
-def not_found():
+def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        "success": False,
-        "error": "Not found"
-    }), 404
+    return _NOT_FOUND()
+
+
+@app.errorhandler(429)
+def too_many_requests(error):
+    """Handle rate limit errors"""
+    return _TOO_MANY_REQUESTS()
 
 
 @app.errorhandler(500)
-def internal_error():
+def internal_error(error):
     """Handle 500 errors"""
-    return jsonify({
-        "success": False,
-        "error": "Internal server error"
-    }), 500
+    return _INTERNAL_ERROR()
 
 
-def run_server(host=None, port=None, debug=None):
+def run_server(host=None, port=None, debug=None, threads=None):
     """
-    Run the Flask server.
+    Run the game server.
+
+    Uses the multi-threaded waitress WSGI server by default. The Werkzeug
+    development server (with reloader and debugger) is only used when debug
+    mode is enabled and the server is bound to a local address.
 
     Args:
         host (str): Host address (defaults to config)
         port (int): Port number (defaults to config)
         debug (bool): Debug mode (defaults to config)
+        threads (int): Number of waitress worker threads (defaults to config)
     """
     # Use config values if not provided
     host = host or config.HOST
     port = port or config.PORT
     debug = debug if debug is not None else config.FLASK_DEBUG
+    threads = threads or config.SERVER_THREADS
+
+    # Never expose the interactive debugger on a public interface
+    if debug and host not in LOCAL_HOSTS:
+        logger.warning("Debug mode is only allowed on local addresses, disabling it for %s", host)
+        debug = False
+
+    logger.info("Starting %s on http://%s:%s", config.APP_NAME, host, port)
+    logger.info("Flask debug mode: %s", debug)
+
+    if debug:
+        app.run(host=host, port=port, debug=True)
+        return
+
+    from waitress import serve
 
-    logger.info(f"Starting {config.APP_NAME} on http://{host}:{port}")
-    logger.info(f"Flask debug mode: {debug}")
-    print(f"Starting {config.APP_NAME} on http://{host}:{port}")
-    print(f"Open your browser to http://{host}:{port} to play!")
-    app.run(host=host, port=port, debug=debug)
+    logger.info("Serving with waitress (%d threads)", threads)
+    serve(app, host=host, port=port, threads=threads)
 
 
 if __name__ == '__main__':
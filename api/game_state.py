@@ -3,11 +3,32 @@ Game State Manager for API
 Handles game state operations and quest management
 """
 
+import copy
+import functools
+import random
+import re
+import threading
+import uuid
 from datetime import datetime
 
-from generators import generate_quest_with_location
-from generators.dungeon_generator import parse_treasure_to_item
-from save_load import GameState, save_game, load_game, list_saves
+from api.json_provider import dumps_bytes
+from combat import CombatEncounter
+from combat.combat_system import CombatResult
+from generators import (
+    create_character,
+    generate_dungeon,
+    generate_quest_with_location,
+    generate_random_character,
+    list_saved_characters,
+    load_character,
+    save_character
+)
+from generators.dungeon_generator import parse_treasure_to_item, roll_denizen
+from generators.hex_grid import DIRECTIONS_BY_DELTA
+from generators.item import Item, ItemType
+from generators.monster import create_monster_encounter, roll_number_appearing
+from generators.vendor import VendorInventory
+from save_load import GameState, save_game, load_game, list_saves, iter_saves
 from tables import overland_tables, dungeon_tables
 from tables.table_roller import roll_on_table, roll_d6
 from logging_config import get_logger
@@ -15,14 +36,287 @@ from logging_config import get_logger
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Hex changes remembered for state deltas; older clients get the full state
+HEX_CHANGE_HISTORY = 4096
+
+# Exploration dangers whose monsters start a combat encounter
+COMBAT_DANGER_TYPES = frozenset({"Hostile", "Unnatural"})
+
+# Tier of a monster danger such as "Monster (T2)"
+MONSTER_TIER_PATTERN = re.compile(r'Monster.*\(T([12])\)')
+
+# Coin amounts in currency loot such as "2 gold, 5 silver"
+CURRENCY_PATTERN = re.compile(r'(?P<gold>\d+)\s*gold|(?P<silver>\d+)\s*silver', re.IGNORECASE)
+
+# Room dangers whose detail is a single roll on a dungeon table
+DANGER_DETAIL_TABLES = {
+    "Hazard": dungeon_tables.HAZARD,
+    "Trap": dungeon_tables.TRAP,
+}
+
+# Room discoveries whose detail is a single roll on a dungeon table
+DISCOVERY_DETAIL_TABLES = {
+    "Feature": dungeon_tables.FEATURE,
+    "Item": dungeon_tables.ITEM,
+    "Treasure A": dungeon_tables.TREASURE_A,
+}
+
+
+def _save_config(attribute, damage_die, description):
+    """Build a hazard/trap save entry, deriving the attribute's short code once"""
+    return {
+        "attribute": attribute,
+        "attribute_code": attribute.upper()[:3],  # STR, DEX, WIL, TOU
+        "damage_die": damage_die,  # Sides of the damage die, 0 for no damage
+        "description": description
+    }
+
+
+# Save attribute, damage and description for each hazard type
+HAZARD_SAVES = {
+    # Overland hazards
+    "Bog": _save_config("strength", 0, "escape the bog"),
+    "Landslide": _save_config("dexterity", 6, "avoid falling rocks"),
+    "Sinkhole": _save_config("dexterity", 6, "dodge the collapsing ground"),
+    "Poison": _save_config("toughness", 6, "resist the poison"),
+    "Weather": _save_config("toughness", 0, "endure harsh weather"),
+
+    # Dungeon hazards
+    "Debris": _save_config("strength", 0, "clear the debris"),
+    "Collapse": _save_config("toughness", 6, "survive the collapse"),
+    "Vapor": _save_config("toughness", 6, "resist toxic vapors"),
+    "Toxin": _save_config("toughness", 6, "resist the toxin"),
+    "Ruin": _save_config("dexterity", 6, "avoid crumbling ruins")
+}
+_DEFAULT_HAZARD_SAVE = _save_config("toughness", 6, "survive")
+
+# Save attribute, damage and description for each trap type
+TRAP_SAVES = {
+    "Pit": _save_config("dexterity", 6, "dodge the pit trap"),
+    "Dart": _save_config("dexterity", 6, "dodge the poison dart"),
+    "Spike": _save_config("dexterity", 6, "avoid the spike trap"),
+    "Pendulum": _save_config("dexterity", 6, "duck under the swinging blade"),
+    "Boulder": _save_config("toughness", 6, "withstand the rolling boulder"),
+    "Acid": _save_config("toughness", 6, "resist the acid spray")
+}
+_DEFAULT_TRAP_SAVE = _save_config("dexterity", 6, "avoid the trap")
+
+
+def _roll_attribute_save(kind, name, save, player):
+    """
+    Roll 1d20 against a player attribute (at or under succeeds) and apply damage on failure.
+
+    Args:
+        kind (str): Result key naming the source, "hazard" or "trap"
+        name (str): Name of the hazard or trap
+        save (dict): Entry from HAZARD_SAVES or TRAP_SAVES
+        player: Player character
+
+    Returns:
+        dict: Save result with roll, target, success, and consequences
+    """
+    attribute_value = getattr(player, save["attribute"], 10)
+    roll = random.randint(1, 20)
+    success = roll <= attribute_value
+
+    result = {
+        kind: name,
+        "attribute": save["attribute_code"],
+        "roll": roll,
+        "target": attribute_value,
+        "success": success,
+        "description": save["description"]
+    }
+
+    # Apply consequences
+    if not success and save["damage_die"]:
+        # Failed save - take damage
+        damage = random.randint(1, save["damage_die"])
+        player.hp_current = max(0, player.hp_current - damage)
+        result["damage"] = damage
+        result["consequence"] = f"Failed to {save['description']}! Took {damage} damage."
+    elif not success:
+        result["consequence"] = f"Failed to {save['description']}, but no damage taken."
+    else:
+        result["consequence"] = f"Successfully {save['description']}!"
+
+    return result
+
+
+def _monster_tier(danger_type):
+    """
+    Get the tier of a monster danger.
+
+    Args:
+        danger_type (str): Dungeon danger type, e.g. "Monster (T1)"
+
+    Returns:
+        int: 1 or 2, or None if the danger isn't a monster
+    """
+    match = MONSTER_TIER_PATTERN.search(danger_type) if danger_type else None
+    return int(match.group(1)) if match else None
+
+
+@functools.lru_cache(maxsize=64)
+def _legacy_consumable_effect(item_name):
+    """
+    Classify a legacy string consumable by the keywords in its name.
+
+    Inventories hold the same few names, so each is only classified once.
+
+    Args:
+        item_name (str): Inventory item, e.g. "Healing Herbs"
+
+    Returns:
+        tuple: ("heal", HP restored) or ("cure_poison", 0), or None if the
+            item isn't a usable consumable
+    """
+    item_lower = item_name.lower()
+
+    # Healing items (healing herbs, healing potion, etc.), by strength
+    if "healing" in item_lower or "herb" in item_lower or "potion" in item_lower:
+        if "minor" in item_lower or "herb" in item_lower:
+            return "heal", 3
+        if "greater" in item_lower or "major" in item_lower:
+            return "heal", 6
+        return "heal", 4  # Default healing
+
+    if "antidote" in item_lower:
+        return "cure_poison", 0
+
+    return None
+
+
+def _apply_heal(player, item):
+    """Heal the player by a consumable's healing amount, capped at max HP"""
+    hp_current = player.hp_current
+    missing_hp = player.hp_max - hp_current
+    if missing_hp <= 0:
+        raise ValueError("Already at full health")
+
+    heal_amount = min(item.healing_amount, missing_hp)
+    player.hp_current = hp_current + heal_amount
+    return f"Healed {heal_amount} HP"
+
+
+def _apply_cure_poison(player, item):
+    """Cure poison; for now just feedback, as the poison system isn't implemented yet"""
+    return "Cured poison (if any)"
+
+
+def _apply_buff(player, item):
+    """Apply a temporary buff; for now just feedback, as there is no buff system to track duration"""
+    return f"Applied {item.effect_type.replace('_', ' ')} buff for {item.effect_duration} turns"
+
+
+# Handlers for consumable Item effect types, called with (player, item); each
+# returns the effect description for the response
+CONSUMABLE_EFFECTS = {
+    "heal": _apply_heal,
+    "cure_poison": _apply_cure_poison,
+    "buff_attack": _apply_buff,
+    "buff_defense": _apply_buff,
+}
+
+
+def _serialize_dangers(dangers):
+    """
+    Convert the Monster objects in dangers' details to dicts.
+
+    Only dangers carrying Monster objects are copied; the rest (and monsters
+    already stored as dicts, e.g. from a loaded save) are passed through as is.
+
+    Args:
+        dangers (list): Danger dicts from a hex or exploration result
+
+    Returns:
+        tuple: (serialized danger list, whether any Monster objects were found)
+    """
+    serialized = []
+    has_monsters = False
+    for danger in dangers:
+        detail = danger.get("detail")
+        if isinstance(detail, dict):
+            monsters = detail.get("monsters")
+            if monsters and not isinstance(monsters[0], dict):
+                danger = {**danger, "detail": {**detail, "monsters": [m.to_dict() for m in monsters]}}
+                has_monsters = True
+        serialized.append(danger)
+    return serialized, has_monsters
+
+
+def _serialize_exploration_result(result):
+    """
+    Convert the Monster objects in an exploration result's dangers to dicts.
+
+    The result is only copied when it actually carries Monster objects.
+
+    Args:
+        result (dict): Result of Hex.explore()
+
+    Returns:
+        dict: JSON-serializable exploration result
+    """
+    dangers, has_monsters = _serialize_dangers(result.get("dangers", ()))
+    if not has_monsters:
+        return result
+    return {**result, "dangers": dangers}
+
+
+def mutates_state(method):
+    """
+    Mark a GameManager method as one that may change the game state.
+
+    state_version is bumped before the method runs, so anything cached for
+    the previous version (including get_state's payload) is rebuilt the next
+    time it is asked for, even from inside the method itself.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.state_version += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
 
 class GameManager:
     """Manages game state for the API"""
 
-    def __init__(self):
-        """Initialize game manager with new game"""
-        self.game_state = GameState()
+    def __init__(self, game_state=None):
+        """
+        Initialize game manager.
 
+        Args:
+            game_state (GameState): State to play on; a new game if omitted
+        """
+        self.game_state = game_state if game_state is not None else GameState()
+        # Held by the API around every request so threaded servers never
+        # interleave reads and writes of the shared game state
+        self.lock = threading.RLock()
+        # Bumped whenever the state may change (by the @mutates_state methods
+        # and by the API's write requests), so reads can reuse anything built
+        # for the current version
+        self.state_version = 0
+        # Prefixes the revisions handed to clients, so one held from another
+        # process or manager never matches a version of this one
+        self.revision_epoch = uuid.uuid4().hex[:8]
+        # get_state payload as (state_version, dict)
+        self._state_cache = (None, None)
+        # _hex_to_client_format results keyed by (q, r), as
+        # [hex_obj, hex_obj.version, has_dungeon, dict, JSON bytes or None]
+        self._hex_format_cache = {}
+        # get_state_bytes result as (state_version, bytes)
+        self._state_bytes_cache = (None, None)
+        # Hex changes as (state_version, (q, r)) in version order, for deltas.
+        # Deltas can be served for any version from _hex_changes_floor on.
+        self._hex_changes = []
+        self._hex_changes_floor = 0
+        # Hexes whose monsters keep them out of _hex_format_cache; deltas
+        # always include them
+        self._monster_hexes = set()
+        # Last _dungeon_coordinates() seen, to flag both hexes when it moves
+        self._last_dungeon_coords = None
+
+    @mutates_state
     def new_game(self):
         """
         Start a new game.
@@ -31,38 +325,168 @@ class GameManager:
             dict: New game state
         """
         self.game_state = GameState()
+        self._reset_hex_tracking()
         return self.get_state()
 
-    def get_state(self):
+    def get_state(self, since_revision=None):
         """
         Get complete game state for client.
 
+        The payload is built once per state_version; callers must not modify it.
+        Its hex_grid carries the version as "revision". Passing a revision back
+        as since_revision limits hex_grid's hexes to the ones changed since
+        then, marking the payload with "since"; a revision too old to answer
+        that way, or from another process, gets the complete state.
+
+        Args:
+            since_revision (str, optional): hex_grid revision the client holds
+
         Returns:
             dict: Complete game state including party and combat
         """
+        if since_revision is not None:
+            return self._build_state_delta(since_revision)
+        version, state = self._state_cache
+        if version != self.state_version:
+            state = self._build_state()
+            self._state_cache = (self.state_version, state)
+        return state
+
+    @property
+    def revision(self):
+        """str: Client-facing name for the current state version"""
+        return f"{self.revision_epoch}-{self.state_version}"
+
+    def _parse_revision(self, revision):
+        """Return the state version named by a revision of this manager, or None"""
+        epoch, _, version = str(revision).rpartition('-')
+        if epoch != self.revision_epoch or not version.isdigit():
+            return None
+        return int(version)
+
+    def get_state_bytes(self):
+        """
+        Get the get_state payload serialized as JSON.
+
+        Hexes are encoded once and their bytes spliced into each new payload
+        until the hex changes, so only the rest of the state is re-encoded.
+
+        Returns:
+            bytes: UTF-8 encoded JSON, equal to dumps_bytes(get_state())
+        """
+        version, body = self._state_bytes_cache
+        if version != self.state_version:
+            body = self._build_state_bytes()
+            self._state_bytes_cache = (self.state_version, body)
+        return body
+
+    def _build_state_bytes(self):
+        """Encode the get_state payload, reusing each hex's cached bytes"""
+        state = self.get_state()
+        hex_grid = self.game_state.hex_grid
+        dungeon_coords = self._dungeon_coordinates()
+        hexes = b','.join(
+            self._hex_to_client_bytes(hex_obj, dungeon_coords) for hex_obj in hex_grid.hexes.values()
+        )
+        visible_hexes = b','.join(
+            self._hex_to_client_bytes(hex_obj, dungeon_coords) for hex_obj in hex_grid.get_visible_hexes()
+        )
+        rest = dumps_bytes({key: value for key, value in state.items() if key != "hex_grid"})
+        return b''.join((
+            b'{"hex_grid":{"player_position":', dumps_bytes(state["hex_grid"]["player_position"]),
+            b',"revision":', dumps_bytes(state["hex_grid"]["revision"]),
+            b',"hexes":[', hexes, b'],"visible_hexes":[', visible_hexes, b']},',
+            rest[1:]
+        ))
+
+    def _build_state(self):
+        """Build the get_state payload from the current game state"""
+        self._collect_hex_changes()
+        dungeon_coords = self._dungeon_coordinates()
+        return self._state_payload({
+            "player_position": self.game_state.hex_grid.player_position,
+            "revision": self.revision,
+            "hexes": [
+                self._hex_to_client_format(hex_obj, dungeon_coords)
+                for hex_obj in self.game_state.hex_grid.hexes.values()
+            ],
+            "visible_hexes": [
+                self._hex_to_client_format(hex_obj, dungeon_coords)
+                for hex_obj in self.game_state.hex_grid.get_visible_hexes()
+            ]
+        })
+
+    def _build_state_delta(self, since_revision):
+        """Build a get_state payload holding only the hexes changed after since_revision"""
+        self._collect_hex_changes()
+        since = self._parse_revision(since_revision)
+        if since is None or not self._hex_changes_floor <= since <= self.state_version:
+            return self.get_state()
+
+        changed = set(self._monster_hexes)
+        for version, coords in reversed(self._hex_changes):
+            if version <= since:
+                break
+            changed.add(coords)
+
+        dungeon_coords = self._dungeon_coordinates()
+        hexes = self.game_state.hex_grid.hexes
+        changed_hexes = [
+            self._hex_to_client_format(hexes[coords], dungeon_coords)
+            for coords in sorted(changed) if coords in hexes
+        ]
+        return self._state_payload({
+            "player_position": self.game_state.hex_grid.player_position,
+            "revision": self.revision,
+            "since": since_revision,
+            "hexes": changed_hexes,
+            "visible_hexes": [data for data in changed_hexes if data["revealed"] or data["explored"]]
+        })
+
+    def _collect_hex_changes(self):
+        """Move the grid's changed hexes into the change log under the current version"""
+        hex_grid = self.game_state.hex_grid
+        dungeon_coords = self._dungeon_coordinates()
+        if dungeon_coords != self._last_dungeon_coords:
+            # Both hexes' has_dungeon flags changed
+            hex_grid.changed_hexes.update(
+                coords for coords in (self._last_dungeon_coords, dungeon_coords) if coords
+            )
+            self._last_dungeon_coords = dungeon_coords
+        if not hex_grid.changed_hexes:
+            return
+
+        self._hex_changes.extend((self.state_version, coords) for coords in hex_grid.changed_hexes)
+        hex_grid.changed_hexes.clear()
+        if len(self._hex_changes) > HEX_CHANGE_HISTORY:
+            dropped = len(self._hex_changes) - HEX_CHANGE_HISTORY // 2
+            self._hex_changes_floor = self._hex_changes[dropped - 1][0]
+            del self._hex_changes[:dropped]
+
+    def _reset_hex_tracking(self):
+        """Forget per-hex caches and change history after the grid is replaced"""
+        self._hex_format_cache.clear()
+        self._hex_changes.clear()
+        self._hex_changes_floor = self.state_version
+        self._monster_hexes.clear()
+        self._last_dungeon_coords = None
+        self.game_state.hex_grid.changed_hexes.clear()
+
+    def _state_payload(self, hex_grid):
+        """Assemble the get_state payload around an already built hex_grid section"""
+        active_index = self.game_state.active_quest_index
+        quests = [quest.to_dict() for quest in self.game_state.quests]
         return {
-            "hex_grid": {
-                "player_position": self.game_state.hex_grid.player_position,
-                "hexes": [
-                    self._hex_to_client_format(hex_obj)
-                    for hex_obj in self.game_state.hex_grid.hexes.values()
-                ],
-                "visible_hexes": [
-                    self._hex_to_client_format(hex_obj)
-                    for hex_obj in self.game_state.hex_grid.get_visible_hexes()
-                ]
-            },
+            "hex_grid": hex_grid,
             "quests": [
-                {
-                    **quest.to_dict(),
-                    "index": i,
-                    "is_active": i == self.game_state.active_quest_index
-                }
-                for i, quest in enumerate(self.game_state.quests)
+                {**quest, "index": i, "is_active": i == active_index}
+                for i, quest in enumerate(quests)
             ],
+            # The active quest reuses its entry in quests rather than being
+            # serialized again
             "active_quest": {
-                **self.game_state.active_quest.to_dict(),
-                "index": self.game_state.active_quest_index
+                **quests[active_index],
+                "index": active_index
             } if self.game_state.active_quest else None,
             "completed_quests": [
                 {
@@ -87,22 +511,41 @@ class GameManager:
             "game_over_reason": self.game_state.game_over_reason
         }
 
-    def _hex_to_client_format(self, hex_obj):
+    def _dungeon_coordinates(self):
+        """
+        Get the location of the active quest's dungeon.
+
+        Returns:
+            tuple: (q, r) of the active quest's destination if it has a
+            dungeon, otherwise None
+        """
+        quest = self.game_state.active_quest
+        if quest and quest.dungeon and quest.coordinates:
+            return tuple(quest.coordinates)
+        return None
+
+    def _hex_to_client_format(self, hex_obj, dungeon_coords):
         """
         Convert hex to client-friendly format.
 
+        The result is reused until the hex is explored or revealed again, or its
+        dungeon flag changes. Hexes holding monsters are always rebuilt, since
+        combat changes the monsters' stats. Callers must not modify the result.
+
         Args:
             hex_obj (Hex): Hex object
+            dungeon_coords (tuple): Result of _dungeon_coordinates(), computed
+                once by callers formatting many hexes
 
         Returns:
             dict: Client-formatted hex data
         """
-        # Check if this hex has a dungeon (from active quest)
-        has_dungeon = False
-        if self.game_state.active_quest and self.game_state.active_quest.dungeon:
-            quest_coords = self.game_state.active_quest.coordinates
-            if quest_coords and hex_obj.q == quest_coords[0] and hex_obj.r == quest_coords[1]:
-                has_dungeon = True
+        key = (hex_obj.q, hex_obj.r)
+        has_dungeon = key == dungeon_coords
+        cached = self._hex_format_cache.get(key)
+        if (cached is not None and cached[0] is hex_obj
+                and cached[1] == hex_obj.version and cached[2] == has_dungeon):
+            return cached[3]
 
         data = {
             "q": hex_obj.q,
@@ -121,24 +564,43 @@ class GameManager:
             data["weather"] = hex_obj.weather
             data["discoveries"] = hex_obj.discoveries
 
-            # Serialize dangers (convert Monster objects to dicts)
-            serialized_dangers = []
-            for danger in hex_obj.dangers:
-                danger_copy = danger.copy()
-                # If danger detail contains monsters, serialize them
-                if isinstance(danger_copy.get("detail"), dict) and "monsters" in danger_copy["detail"]:
-                    detail_copy = danger_copy["detail"].copy()
-                    from generators.monster import Monster
-                    monsters = detail_copy.get("monsters", [])
-                    if monsters:
-                        detail_copy["monsters"] = [m.to_dict() for m in monsters]
-                    danger_copy["detail"] = detail_copy
-                serialized_dangers.append(danger_copy)
-            data["dangers"] = serialized_dangers
+            data["dangers"], has_monsters = _serialize_dangers(hex_obj.dangers)
+        else:
+            has_monsters = False
 
+        if has_monsters:
+            self._monster_hexes.add(key)
+        else:
+            self._hex_format_cache[key] = [hex_obj, hex_obj.version, has_dungeon, data, None]
+            if key in self._monster_hexes:
+                # Its monsters are gone; flag it for clients that last saw them
+                self._monster_hexes.discard(key)
+                self.game_state.hex_grid.changed_hexes.add(key)
         return data
 
-    def _process_hazard_save(self, hazard_name, player):
+    def _hex_to_client_bytes(self, hex_obj, dungeon_coords):
+        """
+        Get _hex_to_client_format's result encoded as JSON.
+
+        The bytes are kept alongside the cached dict and reused with it.
+
+        Args:
+            hex_obj (Hex): Hex object
+            dungeon_coords (tuple): Result of _dungeon_coordinates()
+
+        Returns:
+            bytes: UTF-8 encoded JSON for the hex
+        """
+        data = self._hex_to_client_format(hex_obj, dungeon_coords)
+        cached = self._hex_format_cache.get((hex_obj.q, hex_obj.r))
+        if cached is None or cached[3] is not data:
+            return dumps_bytes(data)
+        if cached[4] is None:
+            cached[4] = dumps_bytes(data)
+        return cached[4]
+
+    @staticmethod
+    def _process_hazard_save(hazard_name, player):
         """
         Process a hazard save according to Single Sheet rules (page 3).
         Roll 1d20 equal to or under the relevant attribute to avoid the hazard.
@@ -150,61 +612,8 @@ class GameManager:
         Returns:
             dict: Save result with roll, target, success, and consequences
         """
-        import random
-
-        # Determine appropriate save attribute and damage for each hazard type
-        hazard_config = {
-            # Overland hazards
-            "Bog": {"attribute": "strength", "damage": 0, "description": "escape the bog"},
-            "Landslide": {"attribute": "dexterity", "damage": "1d6", "description": "avoid falling rocks"},
-            "Sinkhole": {"attribute": "dexterity", "damage": "1d6", "description": "dodge the collapsing ground"},
-            "Poison": {"attribute": "toughness", "damage": "1d6", "description": "resist the poison"},
-            "Weather": {"attribute": "toughness", "damage": 0, "description": "endure harsh weather"},
-
-            # Dungeon hazards
-            "Debris": {"attribute": "strength", "damage": 0, "description": "clear the debris"},
-            "Collapse": {"attribute": "toughness", "damage": "1d6", "description": "survive the collapse"},
-            "Vapor": {"attribute": "toughness", "damage": "1d6", "description": "resist toxic vapors"},
-            "Toxin": {"attribute": "toughness", "damage": "1d6", "description": "resist the toxin"},
-            "Ruin": {"attribute": "dexterity", "damage": "1d6", "description": "avoid crumbling ruins"}
-        }
-
-        config = hazard_config.get(hazard_name, {"attribute": "toughness", "damage": "1d6", "description": "survive"})
-
-        # Get the appropriate attribute value
-        attribute_name = config["attribute"]
-        attribute_value = getattr(player, attribute_name, 10)
-
-        # Roll 1d20 vs attribute (≤ attribute = success)
-        roll = random.randint(1, 20)
-        success = roll <= attribute_value
-
-        result = {
-            "hazard": hazard_name,
-            "attribute": attribute_name.upper()[:3],  # STR, DEX, WIL, TOU
-            "roll": roll,
-            "target": attribute_value,
-            "success": success,
-            "description": config["description"]
-        }
-
-        # Apply consequences
-        if not success and config["damage"]:
-            # Failed save - take damage
-            if config["damage"] == "1d6":
-                damage = random.randint(1, 6)
-            else:
-                damage = 0
-
-            player.hp_current = max(0, player.hp_current - damage)
-            result["damage"] = damage
-            result["consequence"] = f"Failed to {config['description']}! Took {damage} damage."
-        elif not success:
-            result["consequence"] = f"Failed to {config['description']}, but no damage taken."
-        else:
-            result["consequence"] = f"Successfully {config['description']}!"
-
-        return result
+        save = HAZARD_SAVES.get(hazard_name, _DEFAULT_HAZARD_SAVE)
+        return _roll_attribute_save("hazard", hazard_name, save, player)
 
     @staticmethod
     def _process_trap_save(trap_name, player):
@@ -219,56 +628,10 @@ class GameManager:
         Returns:
             dict: Save result with roll, target, success, and consequences
         """
-        import random
-
-        # Determine appropriate save attribute and damage for each trap type
-        trap_config = {
-            "Pit": {"attribute": "dexterity", "damage": "1d6", "description": "dodge the pit trap"},
-            "Dart": {"attribute": "dexterity", "damage": "1d6", "description": "dodge the poison dart"},
-            "Spike": {"attribute": "dexterity", "damage": "1d6", "description": "avoid the spike trap"},
-            "Pendulum": {"attribute": "dexterity", "damage": "1d6", "description": "duck under the swinging blade"},
-            "Boulder": {"attribute": "toughness", "damage": "1d6", "description": "withstand the rolling boulder"},
-            "Acid": {"attribute": "toughness", "damage": "1d6", "description": "resist the acid spray"}
-        }
-
-        config = trap_config.get(trap_name,
-                                 {"attribute": "dexterity", "damage": "1d6", "description": "avoid the trap"})
-
-        # Get the appropriate attribute value
-        attribute_name = config["attribute"]
-        attribute_value = getattr(player, attribute_name, 10)
-
-        # Roll 1d20 vs attribute (≤ attribute = success)
-        roll = random.randint(1, 20)
-        success = roll <= attribute_value
-
-        result = {
-            "trap": trap_name,
-            "attribute": attribute_name.upper()[:3],  # DEX or TOU
-            "roll": roll,
-            "target": attribute_value,
-            "success": success,
-            "description": config["description"]
-        }
-
-        # Apply consequences
-        if not success and config["damage"]:
-            # Failed save - take damage
-            if config["damage"] == "1d6":
-                damage = random.randint(1, 6)
-            else:
-                damage = 0
-
-            player.hp_current = max(0, player.hp_current - damage)
-            result["damage"] = damage
-            result["consequence"] = f"Failed to {config['description']}! Took {damage} damage."
-        elif not success:
-            result["consequence"] = f"Failed to {config['description']}, but no damage taken."
-        else:
-            result["consequence"] = f"Successfully {config['description']}!"
-
-        return result
+        save = TRAP_SAVES.get(trap_name, _DEFAULT_TRAP_SAVE)
+        return _roll_attribute_save("trap", trap_name, save, player)
 
+    @mutates_state
     def generate_quest(self):
         """
         Generate a new quest and add to quest list.
@@ -297,24 +660,7 @@ class GameManager:
         if not (current_hex.is_settlement or at_quest_destination):
             raise ValueError("Must be in a settlement to generate quests")
 
-        # Collect all existing quest coordinates to avoid duplicates
-        excluded_coords = []
-
-        # Add active quest coordinates
-        if self.game_state.active_quest and self.game_state.active_quest.coordinates:
-            excluded_coords.append(self.game_state.active_quest.coordinates)
-
-        # Add available quest coordinates
-        for quest in self.game_state.quests:
-            if quest.coordinates:
-                excluded_coords.append(quest.coordinates)
-
-        # Add completed quest coordinates
-        for quest in self.game_state.completed_quests:
-            if quest.coordinates:
-                excluded_coords.append(quest.coordinates)
-
-        quest = generate_quest_with_location(self.game_state.hex_grid, excluded_coords)
+        quest = generate_quest_with_location(self.game_state.hex_grid, self._quest_coordinates())
         self.game_state.quests.append(quest)
         quest_index = len(self.game_state.quests) - 1
 
@@ -324,6 +670,23 @@ class GameManager:
             "is_active": False
         }
 
+    def _quest_coordinates(self):
+        """
+        Collect the destinations of all current and completed quests.
+
+        The active quest is one of game_state.quests, so it is included.
+
+        Returns:
+            set: (q, r) tuples new quests should avoid
+        """
+        return {
+            tuple(quest.coordinates)
+            for quests in (self.game_state.quests, self.game_state.completed_quests)
+            for quest in quests
+            if quest.coordinates
+        }
+
+    @mutates_state
     def accept_quest(self, quest_index):
         """
         Accept a quest by index.
@@ -349,6 +712,7 @@ class GameManager:
             "message": f"Quest accepted: {quest.action} {quest.target}"
         }
 
+    @mutates_state
     def complete_quest(self, quest_index):
         """
         Complete a quest and roll on CLUE_FOUND table.
@@ -400,28 +764,9 @@ class GameManager:
 
         # On 5 or 6 (Narrative Shift or Clues), generate a new quest
         if clue_result in ["Narrative Shift", "Clues"]:
-            # Collect all existing quest coordinates to avoid duplicates
-            excluded_coords = []
-
-            # Add active quest coordinates (but not the one we just completed)
-            if self.game_state.active_quest and self.game_state.active_quest.coordinates:
-                if self.game_state.active_quest != quest:  # Don't exclude the just-completed quest
-                    excluded_coords.append(self.game_state.active_quest.coordinates)
-
-            # Add available quest coordinates
-            for q in self.game_state.quests:
-                if q.coordinates:
-                    excluded_coords.append(q.coordinates)
-
-            # Add completed quest coordinates (including the one being completed)
-            for q in self.game_state.completed_quests:
-                if q.coordinates:
-                    excluded_coords.append(q.coordinates)
-            # Also add the quest being completed
-            if quest.coordinates:
-                excluded_coords.append(quest.coordinates)
-
-            new_quest = generate_quest_with_location(self.game_state.hex_grid, excluded_coords)
+            # The quest being completed is still in the quest list, so its
+            # destination is excluded too
+            new_quest = generate_quest_with_location(self.game_state.hex_grid, self._quest_coordinates())
             self.game_state.quests.append(new_quest)
             new_quest_index = len(self.game_state.quests) - 1
 
@@ -446,6 +791,7 @@ class GameManager:
 
         return result
 
+    @mutates_state
     def move_player(self, q, r):
         """
         Move player to specific hex coordinates.
@@ -501,17 +847,15 @@ class GameManager:
 
         # Find matching direction or use direct coordinate setting for quest destinations
         direction = None
-        from generators.hex_grid import AXIAL_DIRECTIONS
-        for dir_num, (dir_dq, dir_dr) in AXIAL_DIRECTIONS.items():
-            if dir_dq * distance == dq and dir_dr * distance == dr:
-                direction = dir_num
-                break
+        if dq % distance == 0 and dr % distance == 0:
+            direction = DIRECTIONS_BY_DELTA.get((dq // distance, dr // distance))
 
         if direction:
             # Use normal movement
             result = self.game_state.hex_grid.move_player(direction, distance)
         else:
             # Direct teleport to quest destination
+            self.game_state.hex_grid.changed_hexes.update((current_pos, (q, r)))
             self.game_state.hex_grid.player_position = (q, r)
             if not target_hex.explored:
                 exploration_result = target_hex.explore()
@@ -547,7 +891,6 @@ class GameManager:
             # 3. Quest is not completed
             if quest.coordinates == (q, r) and quest.dungeon is None and not quest.completed:
                 # Generate dungeon when arriving at quest destination
-                from generators import generate_dungeon
                 dungeon = generate_dungeon()
                 quest.dungeon = dungeon
                 # Only show discovery modal if dungeon hasn't been entered yet
@@ -557,80 +900,26 @@ class GameManager:
         # Check for hostile encounters and hazards in explorations
         combat_started = False
         hazard_saves = []
-        logger.debug(f"Checking explorations. Count: {len(result.get('explorations', []))}")
+        logger.debug("Checking explorations. Count: %d", len(result.get('explorations', [])))
+        player = self.game_state.player
         for exp in result.get("explorations", []):
-            logger.debug(f"Exploration keys: {exp.keys()}")
-            logger.debug(f"Exploration result keys: {exp.get('result', {}).keys()}")
-            logger.debug(f"Has dangers: {exp.get('result', {}).get('dangers')}")
-            if exp["result"].get("dangers"):
-                for danger in exp["result"]["dangers"]:
-                    logger.debug(f"Found danger - Type: {danger['type']}, Detail type: {type(danger.get('detail'))}")
-
-                    # Handle hostile encounters
-                    if not combat_started and danger["type"] == "Hostile" and isinstance(danger["detail"], dict):
-                        logger.debug(f"Hostile danger detected! Detail keys: {danger['detail'].keys()}")
-
-                        # Hostile danger with monsters encountered
-                        if "monsters" in danger["detail"] and danger["detail"]["monsters"]:
-                            # Start combat with the monsters
-                            from combat import CombatEncounter
-                            monsters = danger["detail"]["monsters"]
-
-                            logger.info(f"Starting combat with {len(monsters)} monsters")
-                            logger.debug(f"Party size: {len(self.game_state.party)}")
-                            logger.debug(f"Party members: {[char.name for char in self.game_state.party]}")
-
-                            # Create combat encounter (party-based)
-                            self.game_state.active_combat = CombatEncounter(
-                                party=self.game_state.party,
-                                monsters=monsters
-                            )
-                            combat_started = True
-                            logger.info("Combat encounter created successfully")
-                        else:
-                            logger.debug("No monsters found in hostile danger detail")
-                    # Handle unnatural encounters (undead/demons)
-                    elif not combat_started and danger["type"] == "Unnatural" and isinstance(danger["detail"], dict):
-                        # Unnatural danger with monsters encountered
-                        if "monsters" in danger["detail"] and danger["detail"]["monsters"]:
-                            # Start combat with the unnatural monsters
-                            from combat import CombatEncounter
-                            monsters = danger["detail"]["monsters"]
-
-                            # Create combat encounter (party-based)
-                            self.game_state.active_combat = CombatEncounter(
-                                party=self.game_state.party,
-                                monsters=monsters
-                            )
-                            combat_started = True
-                    # Handle hazards with saves
-                    elif danger["type"] == "Hazard" and self.game_state.player:
-                        # Process hazard save
-                        hazard_name = danger.get("detail")
-                        if hazard_name:
-                            save_result = self._process_hazard_save(hazard_name, self.game_state.player)
-                            hazard_saves.append(save_result)
-
-        # Helper function to sanitize exploration results (serialize Monster objects)
-        def sanitize_exploration_result(exp_result):
-            """Serialize non-serializable objects (like Monsters) from exploration results"""
-            sanitized = exp_result.copy()
-            if "dangers" in sanitized:
-                sanitized_dangers = []
-                for danger in sanitized["dangers"]:
-                    danger_copy = danger.copy()
-                    # Serialize Monster objects from detail if present
-                    if isinstance(danger_copy.get("detail"), dict) and "monsters" in danger_copy["detail"]:
-                        detail_copy = danger_copy["detail"].copy()
-                        # Convert Monster objects to dictionaries
-                        from generators.monster import Monster
-                        monsters = detail_copy.get("monsters", [])
-                        if monsters:
-                            detail_copy["monsters"] = [m.to_dict() for m in monsters]
-                        danger_copy["detail"] = detail_copy
-                    sanitized_dangers.append(danger_copy)
-                sanitized["dangers"] = sanitized_dangers
-            return sanitized
+            for danger in exp["result"].get("dangers") or ():
+                danger_type = danger["type"]
+                detail = danger.get("detail")
+                logger.debug("Found danger - Type: %s, Detail type: %s", danger_type, type(detail))
+
+                if danger_type in COMBAT_DANGER_TYPES:
+                    # Hostile and unnatural dangers start combat with their monsters
+                    if not combat_started and isinstance(detail, dict) and detail.get("monsters"):
+                        monsters = detail["monsters"]
+                        logger.info("Starting combat with %d monsters", len(monsters))
+                        self.game_state.active_combat = CombatEncounter(
+                            party=self.game_state.party,
+                            monsters=monsters
+                        )
+                        combat_started = True
+                elif danger_type == "Hazard" and player and detail:
+                    hazard_saves.append(self._process_hazard_save(detail, player))
 
         # Award XP for exploration (1 XP per newly explored hex - PDF rule)
         num_explored = len(result.get("explorations", []))
@@ -650,20 +939,19 @@ class GameManager:
             self.game_state.movement_count = 0
             day_advanced = True
 
-            # Check if ration prompt should be offered
-            if self.game_state.player:
-                has_ration = self.game_state.player.find_item_by_name("Ration") is not None
-                not_at_full_hp = self.game_state.player.hp_current < self.game_state.player.hp_max
-
-                if has_ration and not_at_full_hp:
+            # Offer a ration if the player is hurt and carries one (the HP
+            # check is cheaper than the inventory scan, so it goes first)
+            player = self.game_state.player
+            if player:
+                max_hp = player.hp_max
+                current_hp = player.hp_current
+                if current_hp < max_hp and player.find_item_by_name("Ration") is not None:
                     ration_prompt_available = True
                     # Calculate potential heal amount (half HP, rounded up)
-                    import math
-                    max_hp = self.game_state.player.hp_max
-                    heal_amount = math.ceil(max_hp / 2)
-                    ration_heal_amount = min(heal_amount, max_hp - self.game_state.player.hp_current)
+                    ration_heal_amount = min((max_hp + 1) // 2, max_hp - current_hp)
 
         # Format response
+        dungeon_coords = self._dungeon_coordinates()
         response = {
             "success": True,
             "movement": {
@@ -675,9 +963,10 @@ class GameManager:
                 {
                     "coordinates": exp["hex"],
                     "hex": self._hex_to_client_format(
-                        self.game_state.hex_grid.get_hex_at(exp["hex"][0], exp["hex"][1])
+                        self.game_state.hex_grid.get_hex_at(exp["hex"][0], exp["hex"][1]),
+                        dungeon_coords
                     ),
-                    "results": sanitize_exploration_result(exp["result"])
+                    "results": _serialize_exploration_result(exp["result"])
                 }
                 for exp in result.get("explorations", [])
             ],
@@ -718,7 +1007,7 @@ class GameManager:
         if hex_obj is None:
             return None
 
-        return self._hex_to_client_format(hex_obj)
+        return self._hex_to_client_format(hex_obj, self._dungeon_coordinates())
 
     def save(self, filename=None):
         """
@@ -737,6 +1026,7 @@ class GameManager:
             "message": f"Game saved to {filepath}"
         }
 
+    @mutates_state
     def load(self, filename):
         """
         Load game state from file.
@@ -751,12 +1041,41 @@ class GameManager:
             FileNotFoundError: If save file doesn't exist
         """
         self.game_state = load_game(filename)
+        self._reset_hex_tracking()
         return {
             "success": True,
             "message": f"Game loaded from {filename}",
             "state": self.get_state()
         }
 
+    def snapshot(self):
+        """
+        Take an independent copy of the current game state.
+
+        The copy shares nothing mutable with this manager, so it can be
+        handed to another thread (e.g. to simulate moves) while play goes on.
+
+        Returns:
+            GameState: Deep copy of the game state
+        """
+        with self.lock:
+            return copy.deepcopy(self.game_state)
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Create a manager that plays on from a snapshot.
+
+        The snapshot is copied again, so it can be restored more than once.
+
+        Args:
+            snapshot (GameState): State returned by snapshot()
+
+        Returns:
+            GameManager: New manager owning a copy of the snapshot
+        """
+        return cls(copy.deepcopy(snapshot))
+
     @staticmethod
     def list_saves():
         """
@@ -771,6 +1090,17 @@ class GameManager:
             "saves": saves
         }
 
+    @staticmethod
+    def iter_saves():
+        """
+        Iterate over available save files without building the full list.
+
+        Yields:
+            dict: Save file information, newest first
+        """
+        return iter_saves()
+
+    @mutates_state
     def enter_dungeon(self):
         """
         Enter the dungeon at current location.
@@ -805,46 +1135,80 @@ class GameManager:
             "message": f"Entered {quest.dungeon.name}"
         }
 
-    def get_current_room(self):
+    def _require_dungeon(self):
         """
-        Get current dungeon room information and trigger combat if monsters present.
+        Get the dungeon the player is currently in.
 
         Returns:
-            dict: Room information with contents and combat status
+            Dungeon: The active quest's entered dungeon
 
         Raises:
-            ValueError: If not in a dungeon or no character
+            ValueError: If there is no active quest or its dungeon isn't entered
         """
-        if not self.game_state.active_quest:
+        quest = self.game_state.active_quest
+        if not quest:
             raise ValueError("No active quest")
 
-        quest = self.game_state.active_quest
-        if not quest.dungeon or not quest.dungeon.entered:
+        dungeon = quest.dungeon
+        if not dungeon or not dungeon.entered:
             raise ValueError("Not in a dungeon")
 
+        return dungeon
+
+    def _start_room_combat(self, room):
+        """
+        Start combat with a dungeon room's living monsters.
+
+        Nothing happens if a combat is already active.
+
+        Args:
+            room (DungeonRoom): Room the party is in
+
+        Returns:
+            bool: Whether a combat encounter was started
+        """
+        if self.game_state.active_combat or not room.monsters:
+            return False
+        alive_monsters = room.get_alive_monsters()
+        if not alive_monsters:
+            return False
+
+        # Start combat automatically (party-based)
+        self.game_state.active_combat = CombatEncounter(
+            party=self.game_state.party,
+            monsters=alive_monsters
+        )
+        return True
+
+    def get_current_room(self):
+        """
+        Get current dungeon room information and trigger combat if monsters present.
+
+        Only bumps state_version when it changes the game: starting combat in
+        a grid room, or rolling and recording a room without a grid.
+
+        Returns:
+            dict: Room information with contents and combat status, plus the
+                state revision it was built at
+
+        Raises:
+            ValueError: If not in a dungeon or no character
+        """
+        dungeon = self._require_dungeon()
+
         if not self.game_state.player:
             raise ValueError("No character - create a character first")
 
-        dungeon = quest.dungeon
-
         # Get the actual room from the dungeon grid (if using grid system)
         # Otherwise fall back to simple room generation
         if dungeon.grid:
             current_room = dungeon.grid.get_current_room()
             if current_room:
                 # AUTO-COMBAT TRIGGER: Check if there are alive monsters and no active combat
-                combat_started = False
-                if current_room.monsters:
-                    alive_monsters = [m for m in current_room.monsters if hasattr(m, 'is_alive') and m.is_alive]
-
-                    if alive_monsters and not self.game_state.active_combat:
-                        # Start combat automatically (party-based)
-                        from combat import CombatEncounter
-                        self.game_state.active_combat = CombatEncounter(
-                            party=self.game_state.party,
-                            monsters=alive_monsters
-                        )
-                        combat_started = True
+                combat_started = self._start_room_combat(current_room)
+                if combat_started:
+                    self.state_version += 1
+                combat = self.game_state.active_combat
 
                 # Return room with combat info (even if no monsters)
                 return {
@@ -853,15 +1217,16 @@ class GameManager:
                     "room_number": dungeon.current_room + 1,
                     "total_rooms": dungeon.total_rooms,
                     "room": current_room.to_dict(),
-                    "combat_active": self.game_state.active_combat is not None,
+                    "combat_active": combat is not None,
                     "combat_started": combat_started,
-                    "combat": self.game_state.active_combat.get_combat_status()
-                    if self.game_state.active_combat else None
+                    "combat": combat.get_combat_status() if combat else None,
+                    "revision": self.revision
                 }
 
         # Fallback: Generate simple room contents (for backward compatibility)
         room_type = roll_on_table(dungeon_tables.ROOM)
         room_contents = {"type": room_type}
+        danger_monster = danger_tier = None
 
         if room_type == "Spoor":
             spoor = roll_on_table(dungeon_tables.SPOOR)
@@ -871,20 +1236,16 @@ class GameManager:
             discovery_type = roll_on_table(dungeon_tables.DISCOVERY)
             room_contents["discovery_type"] = discovery_type
 
-            if discovery_type == "Special Room":
+            detail_table = DISCOVERY_DETAIL_TABLES.get(discovery_type)
+            if detail_table is not None:
+                room_contents["discovery_detail"] = roll_on_table(detail_table)
+            elif discovery_type == "Special Room":
                 special_roll = roll_d6()
                 if special_roll <= 3:
                     special_room = roll_on_table(dungeon_tables.SPECIAL_ROOM_1)
                 else:
                     special_room = roll_on_table(dungeon_tables.SPECIAL_ROOM_2)
                 room_contents["discovery_detail"] = special_room
-            elif discovery_type == "Feature":
-                room_contents["discovery_detail"] = roll_on_table(dungeon_tables.FEATURE)
-            elif discovery_type == "Item":
-                room_contents["discovery_detail"] = roll_on_table(dungeon_tables.ITEM)
-            elif discovery_type == "Treasure A":
-                treasure_string = roll_on_table(dungeon_tables.TREASURE_A)
-                room_contents["discovery_detail"] = treasure_string
             elif discovery_type == "Treasure B":
                 # Generate actual Item object from Treasure B
                 treasure_string = roll_on_table(dungeon_tables.TREASURE_B)
@@ -894,7 +1255,7 @@ class GameManager:
                 if self.game_state.player:
                     self.game_state.player.add_item(treasure_item)
                     # Also add gold value if it's coins/gems
-                    if "Coins" in treasure_item.name or "Gem" in treasure_item.name:
+                    if treasure_item.is_currency:
                         self.game_state.player.gold += treasure_item.value
 
                 room_contents["discovery_detail"] = f"Found: {treasure_item.name}"
@@ -906,12 +1267,12 @@ class GameManager:
                 room_contents["also_danger"] = True
                 danger_type = roll_on_table(dungeon_tables.DANGER)
                 room_contents["danger_type"] = danger_type
-                room_contents["danger_detail"] = self._get_danger_detail(danger_type)
+                room_contents["danger_detail"], danger_monster, danger_tier = self._get_danger_detail(danger_type)
 
         elif room_type == "Danger":
             danger_type = roll_on_table(dungeon_tables.DANGER)
             room_contents["danger_type"] = danger_type
-            room_contents["danger_detail"] = self._get_danger_detail(danger_type)
+            room_contents["danger_detail"], danger_monster, danger_tier = self._get_danger_detail(danger_type)
 
         # Store room in explored rooms
         room_data = {
@@ -922,80 +1283,64 @@ class GameManager:
 
         # Check if we need to trigger combat for Monster dangers
         combat_started = False
-        if room_type == "Danger" or room_contents.get("also_danger"):
-            danger_type = room_contents.get("danger_type")
-            if danger_type and "Monster" in danger_type and ("(T1)" in danger_type or "(T2)" in danger_type):
-                # Create monsters and trigger combat
-                from generators.monster import Monster, roll_number_appearing
-                from generators.dungeon_generator import select_denizen_table
-
-                tier = 1 if "(T1)" in danger_type else 2
-                denizen_table = select_denizen_table(tier)
-                roll_2d6 = roll_d6() + roll_d6()
-                monster_data = denizen_table.get(roll_2d6, denizen_table[7])
-
-                num_appearing = roll_number_appearing(tier, solo_pc=True)
-                monsters = []
-                for i in range(num_appearing):
-                    monster = Monster.from_table_entry(monster_data)
-                    if num_appearing > 1:
-                        monster.name = f"{monster.name} #{i + 1}"
-                    monsters.append(monster)
-
-                # Start combat if not already in combat (party-based)
-                if monsters and not self.game_state.active_combat:
-                    from combat import CombatEncounter
-                    self.game_state.active_combat = CombatEncounter(
-                        party=self.game_state.party,
-                        monsters=monsters
-                    )
-                    combat_started = True
-
+        if danger_monster:
+            # Create the monsters the danger detail describes and trigger combat
+            num_appearing = roll_number_appearing(danger_tier, solo_pc=True)
+            monsters = create_monster_encounter(danger_monster, num_appearing)
+
+            # Start combat if not already in combat (party-based)
+            if monsters and not self.game_state.active_combat:
+                self.game_state.active_combat = CombatEncounter(
+                    party=self.game_state.party,
+                    monsters=monsters
+                )
+                combat_started = True
+
+        self.state_version += 1
+        combat = self.game_state.active_combat
         return {
             "success": True,
             "dungeon": dungeon.to_dict(),
             "room_number": dungeon.current_room + 1,
             "total_rooms": dungeon.total_rooms,
             "contents": room_contents,
-            "combat_active": self.game_state.active_combat is not None,
+            "combat_active": combat is not None,
             "combat_started": combat_started,
-            "combat": self.game_state.active_combat.get_combat_status() if self.game_state.active_combat else None
+            "combat": combat.get_combat_status() if combat else None,
+            "revision": self.revision
         }
 
     @staticmethod
     def _get_danger_detail(danger_type):
-        """Get danger details based on type"""
-        from tables import dungeon_tables
-        from generators.dungeon_generator import select_denizen_table
-
-        if danger_type == "Hazard":
-            return roll_on_table(dungeon_tables.HAZARD)
-        elif danger_type == "Trap":
-            return roll_on_table(dungeon_tables.TRAP)
-        elif danger_type == "Encounter":
-            # Roll 2d6 for encounter
-            return "Encounter (roll 2d6 on encounter table)"
-        elif "Monster" in danger_type and ("(T1)" in danger_type or "(T2)" in danger_type):
-            # Handle Monster (T1) and Monster (T2) with DENIZEN tables
-            tier = 1 if "(T1)" in danger_type else 2
+        """
+        Get danger details based on type.
 
-            # Select DENIZEN table based on tier and d6 roll
-            denizen_table = select_denizen_table(tier)
+        Args:
+            danger_type (str): Result rolled on the DANGER table
 
-            # Roll 2d6 on the selected table to get monster
-            roll_2d6 = roll_d6() + roll_d6()
-            monster_data = denizen_table.get(roll_2d6)
+        Returns:
+            tuple: (detail string, DENIZEN entry or None, monster tier or None);
+                the entry and tier are only set for monster dangers
+        """
+        detail_table = DANGER_DETAIL_TABLES.get(danger_type)
+        if detail_table is not None:
+            return roll_on_table(detail_table), None, None
+        if danger_type == "Encounter":
+            # Roll 2d6 for encounter
+            return "Encounter (roll 2d6 on encounter table)", None, None
 
-            # Fallback if roll not in table
-            if not monster_data:
-                monster_data = denizen_table[7]
+        tier = _monster_tier(danger_type)
+        if tier:
+            # Handle Monster (T1) and Monster (T2) with DENIZEN tables
+            monster_data = roll_denizen(tier)
 
             # Return monster name and stats
             return (f"{monster_data['name']} (HD: {monster_data['hd']}, AC: {monster_data['ac']},"
-                    f" Attack: {monster_data['attack']})")
+                    f" Attack: {monster_data['attack']})"), monster_data, tier
 
-        return danger_type
+        return danger_type, None, None
 
+    @mutates_state
     def advance_dungeon_room(self):
         """
         Advance to next room in dungeon by automatically choosing an available exit.
@@ -1006,14 +1351,7 @@ class GameManager:
         Raises:
             ValueError: If not in dungeon or dungeon complete
         """
-        if not self.game_state.active_quest:
-            raise ValueError("No active quest")
-
-        quest = self.game_state.active_quest
-        if not quest.dungeon or not quest.dungeon.entered:
-            raise ValueError("Not in a dungeon")
-
-        dungeon = quest.dungeon
+        dungeon = self._require_dungeon()
 
         if dungeon.current_room >= dungeon.total_rooms:
             return {
@@ -1030,35 +1368,22 @@ class GameManager:
                 current_room = dungeon.grid.get_current_room()
 
                 # Build list of exits that lead to new (un-generated) rooms
-                unexplored_exits = []
-                for exit_dir in available_exits:
-                    new_x, new_y = dungeon.grid.get_adjacent_pos(current_room.x, current_room.y, exit_dir)
-                    if (new_x, new_y) not in dungeon.grid.rooms:
-                        unexplored_exits.append(exit_dir)
+                rooms = dungeon.grid.rooms
+                adjacent_pos = dungeon.grid.get_adjacent_pos
+                x, y = current_room.x, current_room.y
+                unexplored_exits = [
+                    exit_dir for exit_dir in available_exits
+                    if adjacent_pos(x, y, exit_dir) not in rooms
+                ]
 
                 # Prefer unexplored exits, otherwise pick randomly from all exits
-                import random
-                if unexplored_exits:
-                    direction = random.choice(unexplored_exits)
-                else:
-                    direction = random.choice(available_exits)
+                direction = random.choice(unexplored_exits or available_exits)
 
                 new_room = dungeon.move_in_direction(direction)
 
                 if new_room:
                     # AUTO-COMBAT TRIGGER: Check if there are alive monsters and no active combat
-                    combat_started = False
-                    if new_room.monsters:
-                        alive_monsters = [m for m in new_room.monsters if hasattr(m, 'is_alive') and m.is_alive]
-
-                        if alive_monsters and not self.game_state.active_combat:
-                            # Start combat automatically (party-based)
-                            from combat import CombatEncounter
-                            self.game_state.active_combat = CombatEncounter(
-                                party=self.game_state.party,
-                                monsters=alive_monsters
-                            )
-                            combat_started = True
+                    combat_started = self._start_room_combat(new_room)
 
                     # Process traps and hazards in the room
                     trap_saves = []
@@ -1082,21 +1407,24 @@ class GameManager:
                     treasure_collected = []
                     treasure_overflow = None
 
-                    if new_room.treasure and self.game_state.player:
+                    player = self.game_state.player
+                    if new_room.treasure and player:
+                        # Count free slots once; only the items collected below use them up
+                        available_slots = player.get_available_inventory_slots()
+
                         # Process each treasure item
                         remaining_treasure = []
                         for treasure_dict in new_room.treasure:
                             # Convert dict back to Item object
-                            from generators.item import Item
                             treasure_item = Item.from_dict(treasure_dict)
 
                             # Check if player has inventory space
-                            available_slots = self.game_state.player.get_available_inventory_slots()
                             item_slot_size = treasure_item.get_slot_size()
 
                             if available_slots >= item_slot_size:
                                 # Auto-collect treasure
-                                self.game_state.player.add_to_inventory(treasure_item)
+                                player.add_to_inventory(treasure_item)
+                                available_slots -= item_slot_size
                                 treasure_collected.append(treasure_item.to_dict())
                             else:
                                 # Inventory full - set overflow flag for first overflow item only
@@ -1113,14 +1441,14 @@ class GameManager:
                         new_room.treasure = remaining_treasure
 
                     # Success - return the new room data with combat info and save results
+                    combat = self.game_state.active_combat
                     response = {
                         "success": True,
                         "dungeon": dungeon.to_dict(),
                         "direction_moved": direction,
                         "room": new_room.to_dict(),
                         "combat_started": combat_started,
-                        "combat": self.game_state.active_combat.get_combat_status() if self.game_state.active_combat
-                        else None,
+                        "combat": combat.get_combat_status() if combat else None,
                         "trap_saves": trap_saves,
                         "hazard_saves": hazard_saves,
                         "treasure_collected": treasure_collected
@@ -1141,6 +1469,7 @@ class GameManager:
             "message": f"Moved to room {dungeon.current_room + 1}"
         }
 
+    @mutates_state
     def complete_dungeon(self):
         """
         Complete the current dungeon and quest.
@@ -1151,14 +1480,7 @@ class GameManager:
         Raises:
             ValueError: If not in dungeon or not at end
         """
-        if not self.game_state.active_quest:
-            raise ValueError("No active quest")
-
-        quest = self.game_state.active_quest
-        if not quest.dungeon or not quest.dungeon.entered:
-            raise ValueError("Not in a dungeon")
-
-        dungeon = quest.dungeon
+        dungeon = self._require_dungeon()
 
         if dungeon.current_room + 1 < dungeon.total_rooms:
             raise ValueError(
@@ -1178,6 +1500,7 @@ class GameManager:
             "message": "Could not complete quest"
         }
 
+    @mutates_state
     def collect_treasure_with_replacement(self, item_to_drop_name=None):
         """
         Collect treasure from current dungeon room by replacing an inventory item.
@@ -1191,23 +1514,17 @@ class GameManager:
         Raises:
             ValueError: If not in dungeon or no treasure to collect
         """
-        if not self.game_state.active_quest:
-            raise ValueError("No active quest")
-
-        quest = self.game_state.active_quest
-        if not quest.dungeon or not quest.dungeon.entered:
-            raise ValueError("Not in a dungeon")
+        dungeon = self._require_dungeon()
 
         if not self.game_state.player:
             raise ValueError("No player character")
 
         # Get current room
-        current_room = quest.dungeon.grid.get_current_room()
+        current_room = dungeon.grid.get_current_room()
         if not current_room or not current_room.treasure:
             raise ValueError("No treasure in current room")
 
         # Get the first treasure item
-        from generators.item import Item
         treasure_dict = current_room.treasure[0]
         treasure_item = Item.from_dict(treasure_dict)
 
@@ -1221,13 +1538,15 @@ class GameManager:
                 "message": f"Declined {treasure_item.name}"
             }
 
-        # Find and remove the item to drop
-        item_dropped = self.game_state.player.remove_from_inventory(item_to_drop_name)
-        if not item_dropped:
+        # Find and remove the item to drop (an Item or a legacy string)
+        player = self.game_state.player
+        item_dropped = player.find_item_by_name(item_to_drop_name)
+        if item_dropped is None:
             raise ValueError(f"Item '{item_to_drop_name}' not found in inventory")
+        player.remove_item_from_inventory(item_dropped)
 
         # Add new treasure to inventory
-        self.game_state.player.add_to_inventory(treasure_item)
+        player.add_to_inventory(treasure_item)
 
         # Remove treasure from room
         current_room.treasure.pop(0)
@@ -1235,12 +1554,13 @@ class GameManager:
         return {
             "success": True,
             "collected": treasure_item.to_dict(),
-            "dropped": item_dropped.to_dict() if hasattr(item_dropped, 'to_dict') else item_dropped,
+            "dropped": item_dropped.to_dict() if isinstance(item_dropped, Item) else item_dropped,
             "message": f"Collected {treasure_item.name}, dropped {item_to_drop_name}"
         }
 
     # Character Management Methods
 
+    @mutates_state
     def create_character(self, name, race='Human', character_type='Adventurer',
                          strength=10, dexterity=10, willpower=10, toughness=10,
                          special_skill=None, weapon=None, armor=None, shield=None,
@@ -1276,8 +1596,6 @@ class GameManager:
         if len(self.game_state.party) >= 3:
             raise ValueError("Party is full (maximum 3 characters)")
 
-        from generators import create_character
-
         # Create character (gold/silver will be ignored at character level)
         player = create_character(
             name=name,
@@ -1319,6 +1637,7 @@ class GameManager:
             "party_size": len(self.game_state.party)
         }
 
+    @mutates_state
     def generate_random_character(self, name=None):
         """
         Generate a random character and add to party (max 3 characters).
@@ -1336,8 +1655,6 @@ class GameManager:
         if len(self.game_state.party) >= 3:
             raise ValueError("Party is full (maximum 3 characters)")
 
-        from generators import generate_random_character
-
         player = generate_random_character(name)
 
         # Store starting currency from random generation
@@ -1389,8 +1706,6 @@ class GameManager:
         if not self.game_state.player:
             raise ValueError("No character to save")
 
-        from generators import save_character
-
         filepath = save_character(self.game_state.player, filename)
 
         return {
@@ -1399,6 +1714,7 @@ class GameManager:
             "message": f"Character saved to {filepath}"
         }
 
+    @mutates_state
     def load_character(self, filename):
         """
         Load a character from file.
@@ -1412,7 +1728,6 @@ class GameManager:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        from generators import load_character
 
         player = load_character(filename)
         self.game_state.player = player
@@ -1431,7 +1746,6 @@ class GameManager:
         Returns:
             dict: List of characters
         """
-        from generators import list_saved_characters
 
         characters = list_saved_characters()
 
@@ -1442,6 +1756,7 @@ class GameManager:
 
     # Healing Methods
 
+    @mutates_state
     def heal_at_settlement(self):
         """
         Heal the player at a settlement for currency.
@@ -1454,10 +1769,9 @@ class GameManager:
         Raises:
             ValueError: If not at settlement, already at full HP, or not enough currency
         """
-        if not self.game_state.player:
-            raise ValueError("No character - create a character first")
-
         player = self.game_state.player
+        if not player:
+            raise ValueError("No character - create a character first")
 
         # Check if at settlement
         current_hex = self.game_state.hex_grid.get_current_hex()
@@ -1466,11 +1780,12 @@ class GameManager:
             raise ValueError("Must be at a settlement to heal")
 
         # Check if already at full HP
-        if player.hp_current >= player.hp_max:
+        hp_max = player.hp_max
+        missing_hp = hp_max - player.hp_current
+        if missing_hp <= 0:
             raise ValueError("Already at full health")
 
-        # Calculate missing HP and currency cost
-        missing_hp = player.hp_max - player.hp_current
+        # Calculate currency cost
         gold_cost = ((missing_hp - 1) // 10 + 1) * 5  # 5 gold per 10 HP, rounded up
         silver_cost = 0  # Cost in gold only for simplicity
 
@@ -1487,21 +1802,21 @@ class GameManager:
         if not player.remove_currency(silver=silver_cost, gold=gold_cost):
             raise ValueError("Failed to deduct healing cost")
 
-        hp_healed = missing_hp
-        player.hp_current = player.hp_max
+        player.hp_current = hp_max
 
         return {
             "success": True,
-            "hp_healed": hp_healed,
+            "hp_healed": missing_hp,
             "gold_cost": gold_cost,
             "silver_cost": silver_cost,
-            "current_hp": player.hp_current,
+            "current_hp": hp_max,
             "current_gold": player.gold,
             "current_silver": player.silver
         }
 
     # Vendor Transaction Methods
 
+    @mutates_state
     def purchase_item(self, vendor_type, item_name):
         """
         Purchase an item from a vendor at a settlement using party currency/inventory.
@@ -1516,7 +1831,6 @@ class GameManager:
         Raises:
             ValueError: If not at settlement, vendor not available, insufficient currency, or inventory full
         """
-        from generators.vendor import VendorInventory
 
         if not self.game_state.party or len(self.game_state.party) == 0:
             raise ValueError("No party - create a character first")
@@ -1579,13 +1893,15 @@ class GameManager:
 
         return {
             "success": True,
-            "item": item_details,
+            # A copy: the vendor's catalog entry is shared with later purchases
+            "item": dict(item_details),
             "cost_silver": cost_silver,
             "current_gold": self.game_state.party_gold,
             "current_silver": self.game_state.party_silver,
             "inventory": self.game_state.party_inventory
         }
 
+    @mutates_state
     def sell_item(self, item_name):
         """
         Sell an item from party inventory to vendor.
@@ -1600,7 +1916,6 @@ class GameManager:
         Raises:
             ValueError: If not at settlement, item not in inventory, or item cannot be sold
         """
-        from generators.vendor import VendorInventory
 
         if not self.game_state.party or len(self.game_state.party) == 0:
             raise ValueError("No party - create a character first")
@@ -1702,6 +2017,45 @@ class GameManager:
             "combat": self.game_state.active_combat.get_combat_status()
         }
 
+    def _transfer_loot(self, loot):
+        """
+        Give a won combat's loot to the player.
+
+        Currency strings ("5 gold", "3 silver", "2 gold, 5 silver") are added as
+        coins, Item objects go to the inventory, and any other string is kept
+        as a legacy inventory item.
+
+        Args:
+            loot (list): Loot from the combat encounter
+        """
+        player = self.game_state.player
+        total_gold = total_silver = 0
+        found_currency = False
+        for item in loot:
+            if isinstance(item, Item):
+                player.add_item_to_inventory(item)
+                continue
+
+            is_currency = False
+            if isinstance(item, str):
+                for match in CURRENCY_PATTERN.finditer(item):
+                    is_currency = True
+                    if match.group("gold"):
+                        total_gold += int(match.group("gold"))
+                    else:
+                        total_silver += int(match.group("silver"))
+
+            if is_currency:
+                found_currency = True
+            else:
+                # Legacy string item
+                player.add_to_inventory(item)
+
+        if found_currency:
+            # Add all coins at once (auto-converts silver to gold)
+            player.add_currency(silver=total_silver, gold=total_gold)
+
+    @mutates_state
     def combat_attack(self, target_index=0):
         """
         Player attacks in combat.
@@ -1727,53 +2081,34 @@ class GameManager:
                 "combat_ended": True
             }
 
-        combat = self.game_state.active_combat
+        game_state = self.game_state
+        combat = game_state.active_combat
         result = combat.player_attack(target_index)
 
         # If combat ended, transfer loot and clear combat
         if combat.is_combat_over():
-            from combat.combat_system import CombatResult
+            combat_result = combat.combat_result
+            player = game_state.player
 
             # Transfer loot to player inventory on victory
-            if combat.combat_result == CombatResult.VICTORY:
+            if combat_result == CombatResult.VICTORY:
                 if combat.loot:
-                    from generators.item import Item
-                    import re
-
-                    for item in combat.loot:
-                        # Check if it's a currency string (gold and/or silver)
-                        if isinstance(item, str) and ("gold" in item.lower() or "silver" in item.lower()):
-                            # Parse gold and silver amounts
-                            # Format can be: "5 gold", "3 silver", or "2 gold, 5 silver"
-                            gold_match = re.search(r'(\d+)\s*gold', item, re.IGNORECASE)
-                            silver_match = re.search(r'(\d+)\s*silver', item, re.IGNORECASE)
-
-                            gold_amount = int(gold_match.group(1)) if gold_match else 0
-                            silver_amount = int(silver_match.group(1)) if silver_match else 0
-
-                            # Add currency using new currency system (auto-converts silver to gold)
-                            self.game_state.player.add_currency(silver=silver_amount, gold=gold_amount)
-                        elif isinstance(item, Item):
-                            # Add Item object to inventory
-                            self.game_state.player.add_item_to_inventory(item)
-                        else:
-                            # Legacy string item
-                            self.game_state.player.add_to_inventory(item)
+                    self._transfer_loot(combat.loot)
 
                 # Increment encounters defeated counter
-                self.game_state.player.encounters_defeated += 1
-            elif combat.combat_result == CombatResult.DEFEAT:
+                player.encounters_defeated += 1
+            elif combat_result == CombatResult.DEFEAT:
                 # PDF: Death save already handled in combat system
                 # Player is either at 1 HP (save success) or dying (save failed)
                 # Check if player failed death save and is dying
-                if self.game_state.player and self.game_state.player.is_dying:
-                    self.game_state.game_over = True
-                    self.game_state.game_over_reason = "You have died from your wounds."
+                if player and player.is_dying:
+                    game_state.game_over = True
+                    game_state.game_over_reason = "You have died from your wounds."
 
-            self.game_state.active_combat = None
+            game_state.active_combat = None
 
         # Execute monster turn if combat continues
-        if not combat.is_combat_over() and not combat.is_player_turn:
+        elif not combat.is_player_turn:
             combat.monster_turn()
 
         return {
@@ -1782,6 +2117,7 @@ class GameManager:
             "combat_status": combat.get_combat_status()
         }
 
+    @mutates_state
     def combat_use_item(self, item_name):
         """
         Use an item in combat.
@@ -1808,32 +2144,10 @@ class GameManager:
 
         # If combat ended, transfer loot and clear it
         if combat.is_combat_over():
-            from combat.combat_system import CombatResult
 
             # Transfer loot to player inventory on victory
             if combat.combat_result == CombatResult.VICTORY and combat.loot:
-                from generators.item import Item
-                import re
-
-                for item in combat.loot:
-                    # Check if it's a currency string (gold and/or silver)
-                    if isinstance(item, str) and ("gold" in item.lower() or "silver" in item.lower()):
-                        # Parse gold and silver amounts
-                        # Format can be: "5 gold", "3 silver", or "2 gold, 5 silver"
-                        gold_match = re.search(r'(\d+)\s*gold', item, re.IGNORECASE)
-                        silver_match = re.search(r'(\d+)\s*silver', item, re.IGNORECASE)
-
-                        gold_amount = int(gold_match.group(1)) if gold_match else 0
-                        silver_amount = int(silver_match.group(1)) if silver_match else 0
-
-                        # Add currency using new currency system (auto-converts silver to gold)
-                        self.game_state.player.add_currency(silver=silver_amount, gold=gold_amount)
-                    elif isinstance(item, Item):
-                        # Add Item object to inventory
-                        self.game_state.player.add_item_to_inventory(item)
-                    else:
-                        # Legacy string item
-                        self.game_state.player.add_to_inventory(item)
+                self._transfer_loot(combat.loot)
             elif combat.combat_result == CombatResult.DEFEAT:
                 # PDF: Death save already handled in combat system
                 # Player is either at 1 HP (save success) or dying (save failed)
@@ -1842,7 +2156,7 @@ class GameManager:
             self.game_state.active_combat = None
 
         # Execute monster turn if combat continues
-        if not combat.is_combat_over() and not combat.is_player_turn:
+        elif not combat.is_player_turn:
             combat.monster_turn()
 
         return {
@@ -1851,6 +2165,7 @@ class GameManager:
             "combat_status": combat.get_combat_status()
         }
 
+    @mutates_state
     def combat_flee(self):
         """
         Attempt to flee from combat.
@@ -1869,12 +2184,13 @@ class GameManager:
                 "combat_ended": True
             }
 
-        combat = self.game_state.active_combat
+        game_state = self.game_state
+        combat = game_state.active_combat
         result = combat.player_flee()
 
         # Check if combat was already over (race condition)
         if result.get("combat_ended"):
-            self.game_state.active_combat = None
+            game_state.active_combat = None
             return {
                 "success": False,
                 "error": result.get("message", "Combat has already ended"),
@@ -1882,37 +2198,44 @@ class GameManager:
             }
 
         # If fled successfully or combat ended, clear it
-        if result.get("fled") or combat.is_combat_over():
-            from combat.combat_system import CombatResult
+        fled = result.get("fled", False)
+        combat_over = fled or combat.is_combat_over()
+        if combat_over:
 
             # PDF: Death save already handled in combat system
             # Player is either at 1 HP (save success) or dying (save failed)
             if combat.combat_result == CombatResult.DEFEAT:
                 # Check if player failed death save and is dying
-                if self.game_state.player and self.game_state.player.is_dying:
-                    self.game_state.game_over = True
-                    self.game_state.game_over_reason = "You have died from your wounds."
+                player = game_state.player
+                if player and player.is_dying:
+                    game_state.game_over = True
+                    game_state.game_over_reason = "You have died from your wounds."
 
-            self.game_state.active_combat = None
+            game_state.active_combat = None
 
             # BUG FIX: If fled from dungeon combat, clear monsters from room to prevent auto-retrigger
-            if result.get("fled"):
-                quest = self.game_state.active_quest
+            if fled:
+                quest = game_state.active_quest
                 if quest and quest.dungeon and quest.dungeon.entered and quest.dungeon.grid:
                     current_room = quest.dungeon.grid.get_current_room()
                     if current_room:
                         current_room.monsters = []
 
-        # Execute monster turn if failed to flee
-        if not result.get("fled", False) and not combat.is_combat_over():
+        # Execute monster turn if failed to flee (which may end the combat)
+        else:
             combat.monster_turn()
+            combat_over = combat.is_combat_over()
 
-        return {
+        response = {
             "success": True,
-            "flee_result": result,
-            "combat_status": combat.get_combat_status() if not combat.is_combat_over() else None
+            "flee_result": result
         }
+        # Only a combat that is still going has a status to report
+        if not combat_over:
+            response["combat_status"] = combat.get_combat_status()
+        return response
 
+    @mutates_state
     def use_consumable(self, item_name: str):
         """
         Use a consumable item from inventory (outside of combat).
@@ -1926,10 +2249,11 @@ class GameManager:
         Raises:
             ValueError: If item not found, not consumable, or cannot be used
         """
-        from generators.item import Item, ItemType
+
+        player = self.game_state.player
 
         # Find the item in inventory
-        item = self.game_state.player.find_item_by_name(item_name)
+        item = player.find_item_by_name(item_name)
         if not item:
             raise ValueError(f"Item '{item_name}' not found in inventory")
 
@@ -1938,67 +2262,40 @@ class GameManager:
 
         # Handle Item objects with ItemType.CONSUMABLE
         if isinstance(item, Item) and item.item_type == ItemType.CONSUMABLE:
-            if item.effect_type == "heal":
-                if self.game_state.player.hp_current >= self.game_state.player.hp_max:
-                    raise ValueError("Already at full health")
-
-                heal_amount = min(item.healing_amount,
-                                  self.game_state.player.hp_max - self.game_state.player.hp_current)
-                self.game_state.player.hp_current += heal_amount
-                effects_applied.append(f"Healed {heal_amount} HP")
-
-            elif item.effect_type == "cure_poison":
-                # For now, just provide feedback - poison system not yet implemented
-                effects_applied.append("Cured poison (if any)")
-
-            elif item.effect_type in ["buff_attack", "buff_defense"]:
-                # Temporary buffs - would need a buff system to track duration
-                # For now, just provide feedback
-                effects_applied.append(
-                    f"Applied {item.effect_type.replace('_', ' ')} buff for {item.effect_duration} turns")
-
-            else:
+            apply_effect = CONSUMABLE_EFFECTS.get(item.effect_type)
+            if apply_effect is None:
                 raise ValueError(f"Unknown consumable effect: {item.effect_type}")
+            effects_applied.append(apply_effect(player, item))
 
             # Remove Item object from inventory
-            self.game_state.player.remove_item_from_inventory(item)
+            player.remove_item_from_inventory(item)
 
         # Handle legacy string-based healing items
         elif isinstance(item, str):
-            item_lower = item.lower()
+            effect = _legacy_consumable_effect(item)
+            if effect is None:
+                raise ValueError(f"Item '{item_name}' is not a usable consumable")
 
-            # Check if it's a healing item (healing herbs, healing potion, etc.)
-            if "healing" in item_lower or "herb" in item_lower or "potion" in item_lower:
-                if self.game_state.player.hp_current >= self.game_state.player.hp_max:
+            effect_type, heal_amount = effect
+            if effect_type == "heal":
+                hp_current = player.hp_current
+                missing_hp = player.hp_max - hp_current
+                if missing_hp <= 0:
                     raise ValueError("Already at full health")
 
-                # Determine healing amount based on item name
-                if "minor" in item_lower or "herb" in item_lower:
-                    heal_amount = 3
-                elif "greater" in item_lower or "major" in item_lower:
-                    heal_amount = 6
-                else:
-                    heal_amount = 4  # Default healing
-
                 # Cap healing at max HP
-                actual_heal = min(heal_amount, self.game_state.player.hp_max - self.game_state.player.hp_current)
-                self.game_state.player.hp_current += actual_heal
+                actual_heal = min(heal_amount, missing_hp)
+                player.hp_current = hp_current + actual_heal
                 effects_applied.append(f"Healed {actual_heal} HP")
-
-                # Remove string item from inventory
-                self.game_state.player.remove_from_inventory(item)
-
-            elif "antidote" in item_lower:
+            else:
                 # Cure poison
-                if self.game_state.player.remove_status_effect("poisoned"):
+                if player.remove_status_effect("poisoned"):
                     effects_applied.append("Cured poison")
                 else:
                     effects_applied.append("No poison to cure")
 
-                self.game_state.player.remove_from_inventory(item)
-
-            else:
-                raise ValueError(f"Item '{item_name}' is not a usable consumable")
+            # Remove string item from inventory
+            player.remove_from_inventory(item)
 
         else:
             raise ValueError(f"Item '{item_name}' is not a consumable")
@@ -2007,10 +2304,11 @@ class GameManager:
             "success": True,
             "item_used": item_name,
             "effects": effects_applied,
-            "player_hp": self.game_state.player.hp_current,
-            "player_hp_max": self.game_state.player.hp_max
+            "player_hp": player.hp_current,
+            "player_hp_max": player.hp_max
         }
 
+    @mutates_state
     def consume_day_ration(self):
         """
         Consume a ration at day's end to heal half HP (rounded up).
@@ -2021,35 +2319,33 @@ class GameManager:
         Raises:
             ValueError: If no rations available or already at full health
         """
-        import math
 
-        if not self.game_state.player:
+        player = self.game_state.player
+        if not player:
             raise ValueError("No player character")
 
         # Find ration in inventory
-        ration = self.game_state.player.find_item_by_name("Ration")
+        ration = player.find_item_by_name("Ration")
         if not ration:
             raise ValueError("No rations available")
 
         # Check if already at full health
-        if self.game_state.player.hp_current >= self.game_state.player.hp_max:
+        max_hp = player.hp_max
+        missing_hp = max_hp - player.hp_current
+        if missing_hp <= 0:
             raise ValueError("Already at full health")
 
-        # Calculate heal amount (half HP, rounded up)
-        max_hp = self.game_state.player.hp_max
-        heal_amount = math.ceil(max_hp / 2)
-
-        # Apply healing (can't exceed max HP)
-        actual_heal = min(heal_amount, max_hp - self.game_state.player.hp_current)
-        self.game_state.player.hp_current += actual_heal
+        # Heal half HP, rounded up (can't exceed max HP)
+        actual_heal = min((max_hp + 1) // 2, missing_hp)
+        player.hp_current += actual_heal
 
-        # Remove ration from inventory
-        self.game_state.player.remove_from_inventory("Ration")
+        # Remove the ration that was found (an Item or a legacy string)
+        player.remove_item_from_inventory(ration)
 
         return {
             "success": True,
             "item_used": "Ration",
             "heal_amount": actual_heal,
-            "player_hp": self.game_state.player.hp_current,
-            "player_hp_max": self.game_state.player.hp_max
+            "player_hp": player.hp_current,
+            "player_hp_max": max_hp
         }
@@ -0,0 +1,84 @@
+"""
+orjson-backed JSON serialization for the Flask API
+
+Falls back to the standard library encoder where orjson isn't available
+(e.g. PyPy, which orjson doesn't support).
+"""
+
+import json
+from datetime import date
+from enum import Enum
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Allow int/tuple dictionary keys, matching the stdlib encoder's leniency
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+def _default(obj):
+    """
+    Serialize objects the encoders don't handle natively.
+
+    orjson already encodes enums (e.g. ItemType) by value and dates as ISO
+    8601; doing the same here keeps the stdlib fallback's output identical.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+def dumps_bytes(obj):
+    """
+    Serialize an object straight to JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is None:
+        return json.dumps(obj, default=_default, separators=(',', ':')).encode()
+    return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that uses orjson for encoding and decoding"""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string"""
+        return dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes"""
+        if orjson is None:
+            return json.loads(s)
+        return orjson.loads(s)
+
+
+class JSONResponse(Response):
+    """Response whose body is already-serialized JSON bytes"""
+
+    default_mimetype = 'application/json'
+
+    @classmethod
+    def from_payload(cls, payload, status=200):
+        """
+        Serialize a payload with orjson and wrap the bytes without re-encoding.
+
+        Args:
+            payload: JSON-serializable response body
+            status (int): HTTP status code
+
+        Returns:
+            JSONResponse: Response carrying the serialized payload
+        """
+        return cls(dumps_bytes(payload), status=status)
@@ -59,6 +59,18 @@ TERRAIN_ALIASES = {
 }
 
 
+# Tile for every terrain name or alias, with aliases already resolved, so a
+# lookup is a single dict probe
+DEFAULT_TILE = TERRAIN_TILE_MAPPING["plains"]
+RESOLVED_TILES = {
+    **{alias: TERRAIN_TILE_MAPPING.get(terrain, DEFAULT_TILE) for alias, terrain in TERRAIN_ALIASES.items()},
+    **TERRAIN_TILE_MAPPING,
+}
+
+# Every (terrain, tile path) pair; the mapping never changes at runtime
+AVAILABLE_TILES = tuple(TERRAIN_TILE_MAPPING.items())
+
+
 def get_tile_for_terrain(terrain_type: str) -> str:
     """
     Get the hex tile image path for a given terrain type.
@@ -69,26 +81,15 @@ def get_tile_for_terrain(terrain_type: str) -> str:
     Returns:
         Path to the hex tile image, or default tile if not found
     """
-    terrain_lower = terrain_type.lower()
-
-    # Check direct mapping
-    if terrain_lower in TERRAIN_TILE_MAPPING:
-        return TERRAIN_TILE_MAPPING[terrain_lower]
-
-    # Check aliases
-    if terrain_lower in TERRAIN_ALIASES:
-        aliased_terrain = TERRAIN_ALIASES[terrain_lower]
-        return TERRAIN_TILE_MAPPING.get(aliased_terrain, TERRAIN_TILE_MAPPING["plains"])
-
-    # Default to plains if terrain not found
-    return TERRAIN_TILE_MAPPING["plains"]
+    # Direct mappings take precedence over aliases; unknown terrain defaults to plains
+    return RESOLVED_TILES.get(terrain_type.lower(), DEFAULT_TILE)
 
 
 def get_all_available_tiles():
     """
-    Get a list of all available terrain tiles.
+    Get all available terrain tiles.
 
     Returns:
-        List of tuples (terrain_name, file_path)
+        Tuple of (terrain_name, file_path) pairs, built once at import
     """
-    return [(terrain, path) for terrain, path in TERRAIN_TILE_MAPPING.items()]
+    return AVAILABLE_TILES
@@ -4,10 +4,12 @@ Turn-based combat engine with attack rolls, damage, and special abilities
 """
 
 import random
+import re
 from enum import Enum
 from typing import Dict, List
 
 from generators.character import Player
+from generators.item import Item, ItemGenerator
 from generators.monster import Monster
 from tables import table_utilities
 from tables.table_roller import roll_d20
@@ -168,8 +170,6 @@ class CombatEncounter:
 
     def _roll_all_loot(self):
         """Roll loot for all defeated monsters"""
-        from generators.item import Item
-
         for monster in self.monsters:
             if not monster.is_alive:
                 loot_items = self._roll_loot(monster)
@@ -203,9 +203,6 @@ class CombatEncounter:
         Returns:
             List of Item objects and gold amounts
         """
-        from generators.item import ItemGenerator
-        import random
-
         loot_items = []
 
         # Determine tier based on monster (assume tier 1 for now, can be enhanced)
@@ -538,8 +535,6 @@ class CombatEncounter:
         Returns:
             Damage amount
         """
-        import re
-
         match = re.match(r"(\d+)d(\d+)", damage_die)
         if match:
             num_dice = int(match.group(1))
@@ -703,8 +698,6 @@ class CombatEncounter:
 
     def to_dict(self) -> Dict:
         """Serialize combat encounter to dictionary"""
-        from generators.item import Item
-
         # Serialize loot (handle both Item objects and strings)
         serialized_loot = []
         for item in self.loot:
@@ -727,10 +720,6 @@ class CombatEncounter:
     @classmethod
     def from_dict(cls, data: Dict) -> "CombatEncounter":
         """Deserialize combat encounter from dictionary"""
-        from generators.character import Player
-        from generators.monster import Monster
-        from generators.item import Item
-
         # Load party if present (new system), otherwise load single player (legacy)
         party = None
         player = None
@@ -22,6 +22,11 @@ class Config:
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True').lower() in ('true', '1', 'yes')
     HOST = os.getenv('HOST', '127.0.0.1')
     PORT = int(os.getenv('PORT', '5000'))
+    SERVER_THREADS = int(os.getenv('SERVER_THREADS', '8'))
+    # Let a front-end server (e.g. Apache mod_xsendfile) send static files
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', 'False').lower() in ('true', '1', 'yes')
+    # Number of reverse proxies in front of the app whose X-Forwarded-* headers are trusted
+    PROXY_COUNT = int(os.getenv('PROXY_COUNT', '0'))
 
     # Security
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -36,6 +41,11 @@ class Config:
             return '*'
         return [origin.strip() for origin in self.CORS_ORIGINS.split(',')]
 
+    # Rate Limiting (per client IP, in-process memory storage)
+    RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'True').lower() in ('true', '1', 'yes')
+    RATE_LIMIT_READ = os.getenv('RATE_LIMIT_READ', '10/second')
+    RATE_LIMIT_WRITE = os.getenv('RATE_LIMIT_WRITE', '5/second')
+
     # Logging Configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', 'logs/rpg_game.log')
@@ -5,9 +5,12 @@ Handles player character creation, stats, inventory, and equipment
 
 import json
 import os
+import random
+import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from generators.item import Item, ItemSlot
 from tables import overland_tables
 from tables.table_roller import roll_on_table, roll_d6, roll_d20
 
@@ -287,7 +290,6 @@ class Player:
             return False, ""
 
         # Get item name
-        from generators.item import Item
         if isinstance(equipped_item, Item):
             item_name = equipped_item.name
         else:
@@ -592,8 +594,6 @@ class Player:
         Returns:
             Number of slots currently used
         """
-        from generators.item import Item
-
         slots_used = 0
         for item in self.inventory:
             if isinstance(item, Item):
@@ -630,8 +630,6 @@ class Player:
         Returns:
             Tuple of (can_add: bool, reason: str)
         """
-        from generators.item import Item
-
         # Determine item slot size
         slot_size = 1
         if isinstance(item, Item):
@@ -693,8 +691,6 @@ class Player:
         Returns:
             Total armor class
         """
-        from generators.item import Item
-
         # PDF base AC: 10 + TOU bonus
         total_ac = 10 + self.get_ac_bonus()
 
@@ -706,7 +702,6 @@ class Player:
                 total_ac += armor.ac_bonus
             elif isinstance(armor, str) and "AC" in armor:
                 # String-based armor with AC notation
-                import re
                 match = re.search(r'AC\s+(\d+)', armor)
                 if match:
                     # This is absolute AC (like "Chain Mail (AC 16)")
@@ -730,8 +725,6 @@ class Player:
         Returns:
             Total attack bonus
         """
-        from generators.item import Item
-
         # PDF formula: +1 if STR/DEX >= 14 (depending on weapon type)
         # Default to melee (STR bonus)
         ability_bonus = self.get_melee_attack_bonus()
@@ -759,8 +752,6 @@ class Player:
         Returns:
             Damage die string (e.g., "1d8", "2d6")
         """
-        from generators.item import Item
-
         # Check for equipped weapon
         weapon = self.equipment.get("weapon")
         if weapon and isinstance(weapon, Item) and weapon.damage_die:
@@ -768,7 +759,6 @@ class Player:
 
         # Check for string-based weapon with damage notation
         if weapon and isinstance(weapon, str):
-            import re
             match = re.search(r'(\d+d\d+)', weapon)
             if match:
                 return match.group(1)
@@ -784,8 +774,6 @@ class Player:
         Returns:
             Damage bonus to add to damage roll (usually 0)
         """
-        from generators.item import Item
-
         # PDF: No attribute modifiers to damage
         # Only weapon bonuses count
         damage_bonus = 0
@@ -834,8 +822,6 @@ class Player:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        from generators.item import Item, ItemSlot
-
         if not isinstance(item, Item):
             return False, "Not a valid Item object"
 
@@ -897,8 +883,6 @@ class Player:
         Returns:
             The item if found, None otherwise
         """
-        from generators.item import Item
-
         for item in self.inventory:
             if isinstance(item, Item) and item.name == item_name:
                 return item
@@ -910,8 +894,6 @@ class Player:
 
     def to_dict(self) -> Dict:
         """Serialize player to dictionary"""
-        from generators.item import Item
-
         # Serialize inventory (handle both strings and Item objects)
         serialized_inventory = []
         for item in self.inventory:
@@ -992,8 +974,6 @@ class Player:
             damage_die=data.get("damage_die", "1d6"),
         )
 
-        from generators.item import Item
-
         player.hp_current = data.get("hp_current", player.hp_max)
 
         # Deserialize inventory (handle both strings and Item dicts)
@@ -1255,7 +1235,6 @@ def generate_random_character(name: Optional[str] = None) -> Player:
     player.traits = [trait1, trait2]
 
     # Select random special skill (PDF rule: choose one of 6)
-    import random
     special_skills = ["Forestry", "Thieving", "Brutalism", "Alchemy", "Arcanism", "Mentalism"]
     player.special_skill = random.choice(special_skills)
 
@@ -1292,9 +1271,9 @@ def save_character(player: Player, filename: Optional[str] = None) -> str:
 
     filepath = os.path.join(char_dir, filename)
 
-    # Save to file
-    with open(filepath, "w") as f:
-        json.dump(player.to_dict(), f, indent=2)
+    # Save to file (imported here: save_load imports this module)
+    from save_load import write_json
+    write_json(filepath, player.to_dict())
 
     return filepath
 
@@ -9,6 +9,7 @@ import re
 from tables import dungeon_tables
 from tables.table_roller import roll_on_table, roll_d6
 from generators.item import Item, ItemGenerator, ItemType, ItemSlot, ItemRarity
+from generators.monster import Monster, create_monster_encounter, roll_number_appearing
 
 
 def select_denizen_table(tier: int) -> dict:
@@ -37,6 +38,22 @@ def select_denizen_table(tier: int) -> dict:
             return dungeon_tables.DENIZEN_TIER_2_RANGE_3_5
 
 
+def roll_denizen(tier: int) -> dict:
+    """
+    Roll a monster on a DENIZEN table for the tier.
+
+    Args:
+        tier: Monster tier (1 or 2)
+
+    Returns:
+        DENIZEN table entry for the monster
+    """
+    denizen_table = select_denizen_table(tier)
+    # Roll 2d6 on the selected table; the tables cover 2-12, but fall back to
+    # the middle result if a roll is ever missing
+    return denizen_table.get(roll_d6() + roll_d6()) or denizen_table[7]
+
+
 # Handle dice expressions for coins/gems
 # Pattern: "3d6 Gold", "d6 Gems"
 def handle_dice_expressions(treasure_str: str):
@@ -61,6 +78,7 @@ def get_gem_data(total=None):
         slot=ItemSlot.NONE,
         rarity=ItemRarity.UNCOMMON if total > 5 else ItemRarity.COMMON,
         value=gem_value,
+        is_currency=True,
         description=f"{total} precious gem(s) worth {gem_value} gold total"
     )
 
@@ -109,6 +127,7 @@ def parse_treasure_to_item(treasure_string: str, tier: int = 1) -> Item:
             slot=ItemSlot.NONE,
             rarity=ItemRarity.COMMON,
             value=gold_value,
+            is_currency=True,
             description=f"A pouch containing {total} silver coins (worth {gold_value} gold)"
         )
 
@@ -119,6 +138,7 @@ def parse_treasure_to_item(treasure_string: str, tier: int = 1) -> Item:
             slot=ItemSlot.NONE,
             rarity=ItemRarity.COMMON,
             value=total,
+            is_currency=True,
             description=f"A pouch containing {total} gold coins"
         )
 
@@ -132,6 +152,7 @@ def parse_treasure_to_item(treasure_string: str, tier: int = 1) -> Item:
         slot=ItemSlot.NONE,
         rarity=ItemRarity.COMMON,
         value=50,
+        is_currency="gem" in item_type,
         description=treasure_string
     )
 
@@ -185,6 +206,7 @@ def parse_treasure_a_to_item(treasure_string: str, tier: int = 1) -> Item:
             slot=ItemSlot.NONE,
             rarity=ItemRarity.COMMON,
             value=total,
+            is_currency=True,
             description=f"A pouch containing {total} gold coins"
         )
 
@@ -198,6 +220,7 @@ def parse_treasure_a_to_item(treasure_string: str, tier: int = 1) -> Item:
         slot=ItemSlot.NONE,
         rarity=ItemRarity.COMMON,
         value=50,
+        is_currency="gem" in item_type,
         description=treasure_string
     )
 
@@ -239,6 +262,12 @@ class DungeonRoom:
         self.dressing = []
         self.is_special = False
 
+    def __setattr__(self, name, value):
+        """Set an attribute, discarding the cached to_dict() result"""
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
     def add_door(self, direction, door_type, to_coords):
         """Add a door in the specified direction"""
         self.doors[direction] = {
@@ -253,14 +282,31 @@ class DungeonRoom:
         if direction not in self.exits:
             self.exits.append(direction)
 
+    def get_alive_monsters(self):
+        """
+        Get the room's living monsters.
+
+        Returns:
+            list[Monster]: Monsters still alive (legacy dict entries are skipped)
+        """
+        return [m for m in self.monsters if isinstance(m, Monster) and m.is_alive]
+
     def explore(self):
         """Mark room as explored"""
         self.explored = True
 
     def to_dict(self):
-        """Convert room to dictionary"""
+        """
+        Convert room to dictionary.
+
+        The dictionary shares the room's lists and dicts, so in-place changes to
+        them show through. Rooms without monsters reuse it until an attribute
+        is reassigned; callers must not modify it.
+        """
+        if self._dict_cache is not None and not self.monsters:
+            return self._dict_cache
+
         # Serialize monsters properly
-        from generators.monster import Monster
         monsters_data = []
         for monster in self.monsters:
             if isinstance(monster, Monster):
@@ -269,7 +315,7 @@ class DungeonRoom:
                 # Backward compatibility for dict monsters
                 monsters_data.append(monster)
 
-        return {
+        data = {
             "x": self.x,
             "y": self.y,
             "room_type": self.room_type,
@@ -287,6 +333,9 @@ class DungeonRoom:
             "dressing": self.dressing,
             "is_special": self.is_special
         }
+        if not self.monsters:
+            self._dict_cache = data
+        return data
 
     @classmethod
     def from_dict(cls, data):
@@ -306,7 +355,6 @@ class DungeonRoom:
         room.height = data.get("height", 1)
 
         # Deserialize monsters from dicts to Monster objects
-        from generators.monster import Monster
         room.monsters = []
         for monster_data in data.get("monsters", []):
             if isinstance(monster_data, dict) and "name" in monster_data:
@@ -648,21 +696,13 @@ class DungeonGrid:
 
                 # 50% chance encounter spawns monsters
                 if random.random() < 0.5:
-                    from generators.monster import Monster, roll_number_appearing
-
                     # Use tier 1 monsters for encounters
                     tier = 1
-                    denizen_table = select_denizen_table(tier)
-                    roll_2d6 = roll_d6() + roll_d6()
-                    monster_data = denizen_table.get(roll_2d6, denizen_table[7])
+                    monster_data = roll_denizen(tier)
 
                     # 1-2 monsters
                     num_appearing = random.randint(1, 2)
-                    for i in range(num_appearing):
-                        monster = Monster.from_table_entry(monster_data)
-                        if num_appearing > 1:
-                            monster.name = f"{monster.name} #{i + 1}"
-                        room.monsters.append(monster)
+                    room.monsters.extend(create_monster_encounter(monster_data, num_appearing))
                     room.contents["encounter_has_monsters"] = True
 
                 # 30% chance encounter has reward treasure
@@ -673,31 +713,17 @@ class DungeonGrid:
                     room.contents["encounter_has_treasure"] = True
             elif danger_type.startswith("Monster"):
                 # Determine tier based on dungeon depth and create Monster instances
-                from generators.monster import Monster, roll_number_appearing
-
                 # Determine tier
                 tier = 1 if "Tier 1" in danger_type or "(T1)" in danger_type else 2
 
                 # Select DENIZEN table based on tier and d6 roll
-                denizen_table = select_denizen_table(tier)
-
-                # Roll 2d6 on the selected table to get monster
-                roll_2d6 = roll_d6() + roll_d6()
-                monster_data = denizen_table.get(roll_2d6)
-
-                # Fallback if roll not in table (shouldn't happen with 2d6 on 2-12 table)
-                if not monster_data:
-                    monster_data = denizen_table[7]  # Use middle result as fallback
+                monster_data = roll_denizen(tier)
 
                 # Roll for number appearing (1-2 for tier 1, 1 for tier 2)
                 num_appearing = roll_number_appearing(tier, solo_pc=True)
 
                 # Create multiple monster instances
-                for i in range(num_appearing):
-                    monster = Monster.from_table_entry(monster_data)
-                    if num_appearing > 1:
-                        monster.name = f"{monster.name} #{i + 1}"
-                    room.monsters.append(monster)
+                room.monsters.extend(create_monster_encounter(monster_data, num_appearing))
 
         # Add room dressing
         if random.random() < 0.4:  # 40% chance of dressing
@@ -818,7 +844,6 @@ class Dungeon:
     def _calculate_room_count(self):
         """Calculate actual number of rooms from size description"""
         # Parse size string like "2d6+2 Rooms"
-        import re
         match = re.match(r'(\d+)d(\d+)\+(\d+)', self.size)
         if match:
             num_dice = int(match.group(1))
@@ -3,6 +3,9 @@ Hex Grid System for Overland Exploration
 Implements hex grid with axial coordinates for tracking terrain, exploration, and player movement
 """
 
+import random
+
+from generators.monster import create_monster_encounter
 from tables.table_roller import roll_on_table, roll_d6
 from tables import overland_tables
 
@@ -35,10 +38,20 @@ AXIAL_DIRECTIONS = {
     NORTHWEST: (-1, 0)    # Northwest: column left, same row
 }
 
+# Reverse lookup: direction constant for each unit (dq, dr) vector
+DIRECTIONS_BY_DELTA = {delta: direction for direction, delta in AXIAL_DIRECTIONS.items()}
+
 
 class Hex:
     """Represents a single hex on the overland map"""
 
+    __slots__ = ("q", "r", "terrain", "weather", "water", "revealed", "explored", "is_settlement",
+                 "settlement_type", "available_vendors", "discoveries", "dangers", "version")
+
+    # Bumped whenever any hex is revealed or explored, so grids can tell when
+    # their cached list of visible hexes is stale
+    visibility_epoch = 0
+
     def __init__(self, q, r, terrain=None, weather=None, water=None, reference_terrain=None):
         """
         Initialize a hex with axial coordinates.
@@ -108,6 +121,9 @@ class Hex:
         # Dangers in this hex
         self.dangers = []
 
+        # Bumped by explore() and reveal() so serialized copies can be reused
+        self.version = 0
+
     @property
     def coordinates(self):
         """Return coordinates as tuple"""
@@ -124,6 +140,8 @@ class Hex:
             return {"already_explored": True, "discoveries": self.discoveries, "dangers": self.dangers}
 
         self.explored = True
+        self.version += 1
+        Hex.visibility_epoch += 1
         results = {"already_explored": False, "discoveries": [], "dangers": []}
 
         # Roll on EXPLORE_DIE
@@ -227,9 +245,6 @@ class Hex:
 
     def _spawn_hostile_encounter(self):
         """Spawn monsters for a hostile encounter"""
-        from generators.monster import Monster
-        import random
-
         # Get encounter type based on terrain
         encounter_type = self._get_terrain_encounter()
 
@@ -268,12 +283,7 @@ class Hex:
             num_appearing = random.randint(1, 6)
 
         # Create monster instances
-        monsters = []
-        for i in range(num_appearing):
-            monster = Monster.from_table_entry(creature_data)
-            if num_appearing > 1:
-                monster.name = f"{monster.name} #{i + 1}"
-            monsters.append(monster)
+        monsters = create_monster_encounter(creature_data, num_appearing)
 
         # Return encounter info with monsters
         return {
@@ -285,9 +295,6 @@ class Hex:
 
     def _spawn_unnatural_encounter(self):
         """Spawn unnatural monsters (undead/demons) for an unnatural danger"""
-        from generators.monster import Monster
-        import random
-
         # Roll on DANGER_UNNATURAL table to get creature type
         creature_type = roll_on_table(overland_tables.DANGER_UNNATURAL)
 
@@ -313,12 +320,7 @@ class Hex:
             num_appearing = 1
 
         # Create monster instances
-        monsters = []
-        for i in range(num_appearing):
-            monster = Monster.from_table_entry(creature_data)
-            if num_appearing > 1:
-                monster.name = f"{monster.name} #{i + 1}"
-            monsters.append(monster)
+        monsters = create_monster_encounter(creature_data, num_appearing)
 
         # Return encounter info with monsters
         return {
@@ -331,6 +333,8 @@ class Hex:
     def reveal(self):
         """Mark hex as revealed (visible but not yet explored)"""
         self.revealed = True
+        self.version += 1
+        Hex.visibility_epoch += 1
 
     @classmethod
     def from_dict(cls, data):
@@ -397,6 +401,11 @@ class HexGrid:
         """
         self.hexes = {}  # Dictionary of hexes by (q, r) coordinates
         self.player_position = start_position
+        # Coordinates of hexes created or changed since the owner last cleared
+        # the set (GameManager drains it to serve state deltas)
+        self.changed_hexes = set()
+        # get_visible_hexes result as (Hex.visibility_epoch, hex count, list)
+        self._visible_cache = (None, None, None)
 
         # Create starting hex as Village and mark as explored
         start_hex = self.get_or_create_hex(start_position[0], start_position[1], terrain="Village")
@@ -423,6 +432,7 @@ class HexGrid:
         coords = (q, r)
         if coords not in self.hexes:
             self.hexes[coords] = Hex(q, r, terrain, weather, water, reference_terrain)
+            self.changed_hexes.add(coords)
         return self.hexes[coords]
 
     def move_player(self, direction, distance=1):
@@ -458,13 +468,16 @@ class HexGrid:
 
             # Explore if not already explored
             if not hex_obj.explored:
+                self.changed_hexes.add(hex_obj.coordinates)
                 exploration_result = hex_obj.explore()
                 results["explorations"].append({
                     "hex": hex_obj.coordinates,
                     "result": exploration_result
                 })
 
-        # Update player position to final destination
+        # Update player position to final destination, flagging the hex left
+        # behind since combat there may have changed its monsters
+        self.changed_hexes.add(self.player_position)
         self.player_position = (
             self.player_position[0] + (dq * distance),
             self.player_position[1] + (dr * distance)
@@ -508,6 +521,7 @@ class HexGrid:
         # Reveal the destination if requested
         if reveal and not dest_hex.explored:
             dest_hex.reveal()
+            self.changed_hexes.add(dest_hex.coordinates)
 
         return {
             "direction": direction,
@@ -531,6 +545,7 @@ class HexGrid:
         hex_obj = self.get_or_create_hex(q, r)
         if not hex_obj.explored:
             hex_obj.reveal()
+            self.changed_hexes.add(hex_obj.coordinates)
         return hex_obj
 
     def reveal_adjacent_hexes(self, q=None, r=None):
@@ -559,6 +574,7 @@ class HexGrid:
             hex_obj = self.get_or_create_hex(adj_q, adj_r, reference_terrain=reference_terrain)
             if not hex_obj.explored and not hex_obj.revealed:
                 hex_obj.reveal()
+                self.changed_hexes.add(hex_obj.coordinates)
                 revealed.append(hex_obj)
 
         return revealed
@@ -583,11 +599,18 @@ class HexGrid:
         """
         Get all hexes that are visible (revealed or explored).
 
+        The list is reused until a hex is added, revealed or explored; callers
+        must not modify it.
+
         Returns:
             list[Hex]: List of visible hexes
         """
-        return [hex_obj for hex_obj in self.hexes.values()
-                if hex_obj.revealed or hex_obj.explored]
+        epoch, count, visible = self._visible_cache
+        if epoch != Hex.visibility_epoch or count != len(self.hexes):
+            visible = [hex_obj for hex_obj in self.hexes.values()
+                       if hex_obj.revealed or hex_obj.explored]
+            self._visible_cache = (Hex.visibility_epoch, len(self.hexes), visible)
+        return visible
 
     def get_hex_info(self, q, r):
         """
@@ -635,6 +658,8 @@ class HexGrid:
         grid = cls.__new__(cls)  # Create instance without calling __init__
         grid.player_position = player_pos
         grid.hexes = {}
+        grid.changed_hexes = set()
+        grid._visible_cache = (None, None, None)
 
         # Reconstruct all hexes
         for coord_str, hex_data in data["hexes"].items():
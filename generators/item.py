@@ -75,6 +75,9 @@ class Item:
     # PDF inventory system
     is_bulky: bool = False  # Bulky items take 2 slots (Plate, Chain, Great Sword, etc.)
 
+    # Treasure properties
+    is_currency: bool = False  # Coins and gems, whose value is added to the player's gold when found
+
     # Consumable properties
     healing_amount: int = 0
     effect_duration: int = 0
@@ -97,6 +100,7 @@ class Item:
             "damage_reduction": self.damage_reduction,
             "modifiers": self.modifiers,
             "is_bulky": self.is_bulky,
+            "is_currency": self.is_currency,
             "healing_amount": self.healing_amount,
             "effect_duration": self.effect_duration,
             "effect_type": self.effect_type,
@@ -130,6 +134,7 @@ class Item:
             damage_reduction=data.get("damage_reduction", 0),
             modifiers=data.get("modifiers", []),
             is_bulky=data.get("is_bulky", False),
+            is_currency=data.get("is_currency", False),
             healing_amount=data.get("healing_amount", 0),
             effect_duration=data.get("effect_duration", 0),
             effect_type=data.get("effect_type"),
@@ -3,6 +3,8 @@ Monster System
 Handles monster creation, stats, and special abilities
 """
 
+import copy
+import functools
 import random
 import re
 from typing import Dict, List, Optional, Tuple
@@ -69,33 +71,32 @@ class Monster:
         Returns:
             Rolled HP value
         """
-        hd_string = str(hd_string).strip()
+        num_dice, die_size, modifier = Monster._parse_hd(str(hd_string).strip())
+        return max(1, sum(random.randint(1, die_size) for _ in range(num_dice)) + modifier)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_hd(hd_string: str) -> Tuple[int, int, int]:
+        """Parse HD notation into (number of dice, die size, modifier), once per string"""
         # Special case: "1d2HP" format
         if "HP" in hd_string.upper():
             match = re.match(r"(\d+)d(\d+)", hd_string, re.IGNORECASE)
             if match:
-                num_dice = int(match.group(1))
-                die_size = int(match.group(2))
-                return max(1, sum(random.randint(1, die_size) for _ in range(num_dice)))
+                return int(match.group(1)), int(match.group(2)), 0
 
         # Special case: fractional HD like "1/2"
         if "/" in hd_string:
             # 1/2 HD = 1d4 HP
-            return max(1, random.randint(1, 4))
+            return 1, 4, 0
 
         # Parse standard HD format: "2+2", "1-1", "1", "6+4", etc.
         match = re.match(r"(\d+)([+-]\d+)?", hd_string)
         if match:
-            num_dice = int(match.group(1))
-            modifier = int(match.group(2)) if match.group(2) else 0
-
-            # Roll HP: number of d8s + modifier
-            hp = sum(random.randint(1, 8) for _ in range(num_dice)) + modifier
-            return max(1, hp)
+            # Number of d8s + modifier
+            return int(match.group(1)), 8, (int(match.group(2)) if match.group(2) else 0)
 
         # Fallback: treat as single d8
-        return random.randint(1, 8)
+        return 1, 8, 0
 
     def _calculate_xp_from_hd(self, hd_string: str) -> int:
         """
@@ -455,6 +456,23 @@ class Monster:
             special=entry.get("special"),
         )
 
+    def spawn(self) -> "Monster":
+        """
+        Create another monster of the same kind with freshly rolled HP.
+
+        The HD, XP and special abilities already parsed for this monster are
+        reused rather than parsed again.
+
+        Returns:
+            New Monster instance at full health
+        """
+        monster = copy.copy(self)
+        monster.hp_max = monster.hp_current = self._parse_and_roll_hd(self.hd_string)
+        monster.special_abilities = dict(self.special_abilities)
+        monster.is_alive = True
+        monster.status_effects = []
+        return monster
+
 
 def roll_number_appearing(tier: int = 1, solo_pc: bool = False) -> int:
     """
@@ -495,12 +513,18 @@ def create_monster_encounter(monster_data: Dict, count: Optional[int] = None) ->
     if count is None:
         count = roll_number_appearing()
 
-    monsters = []
-    for i in range(count):
-        monster = Monster.from_table_entry(monster_data)
-        # Add number suffix if multiple monsters
-        if count > 1:
-            monster.name = f"{monster.name} #{i + 1}"
-        monsters.append(monster)
+    if count < 1:
+        return []
+
+    # Parse the table entry once; each further monster only rolls its own HP
+    template = Monster.from_table_entry(monster_data)
+    monsters = [template]
+    monsters.extend(template.spawn() for _ in range(count - 1))
+
+    # Add number suffix if multiple monsters
+    if count > 1:
+        name = template.name
+        for i, monster in enumerate(monsters, 1):
+            monster.name = f"{name} #{i}"
 
     return monsters
@@ -10,6 +10,10 @@ from tables import overland_tables
 class Quest:
     """Represents a generated quest"""
 
+    __slots__ = ("action", "target", "where", "opposition", "source", "reward", "direction", "distance",
+                 "coordinates", "completed", "completion_timestamp", "completion_coordinates", "dungeon",
+                 "_dict_cache")
+
     def __init__(self, action, target, where, opposition, source, reward, direction=None, distance=None,
                  coordinates=None, completed=False, completion_timestamp=None,
                  completion_coordinates=None, dungeon=None):
@@ -27,6 +31,12 @@ class Quest:
         self.completion_coordinates = completion_coordinates  # Where quest was completed
         self.dungeon = dungeon  # Dungeon object (generated when arriving at destination)
 
+    def __setattr__(self, name, value):
+        """Set an attribute, discarding the cached to_dict() fields"""
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+
     @classmethod
     def from_dict(cls, data):
         """
@@ -80,7 +90,25 @@ class Quest:
         return base_description
 
     def to_dict(self):
-        """Convert quest to dictionary"""
+        """
+        Convert quest to dictionary.
+
+        Everything but the dungeon is built once and reused until a field is
+        reassigned; the dungeon changes as it is explored, so it is converted
+        on every call.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._fields_dict()
+        result = dict(self._dict_cache)
+
+        # Add dungeon info if exists
+        if self.dungeon is not None:
+            result["dungeon"] = self.dungeon.to_dict()
+
+        return result
+
+    def _fields_dict(self):
+        """Convert the quest's own fields (everything but the dungeon) to a dictionary"""
         result = {
             "action": self.action,
             "target": self.target,
@@ -106,10 +134,6 @@ class Quest:
         if self.completion_coordinates is not None:
             result["completion_coordinates"] = self.completion_coordinates
 
-        # Add dungeon info if exists
-        if self.dungeon is not None:
-            result["dungeon"] = self.dungeon.to_dict()
-
         return result
 
     def formatted_display(self):
@@ -185,7 +209,7 @@ def generate_quest_with_location(hex_grid, excluded_coordinates=None):
 
     Args:
         hex_grid (HexGrid): The hex grid to generate destination on
-        excluded_coordinates (list): List of coordinate tuples to avoid (optional)
+        excluded_coordinates (iterable): Coordinate tuples to avoid (optional)
 
     Returns:
         Quest: A generated quest with direction, distance, and coordinates
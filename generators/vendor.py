@@ -3,6 +3,8 @@ Vendor System
 Manages shop inventories for Armorer, Merchant, and Herbalist vendors in settlements.
 """
 
+import functools
+
 from tables import overland_tables
 
 
@@ -95,13 +97,17 @@ class VendorInventory:
             vendor_type (str): One of "Armorer", "Merchant", "Herbalist"
 
         Returns:
-            dict or list: Vendor inventory
+            dict or list: Vendor inventory (shared between callers; don't mutate)
 
         Raises:
             ValueError: If vendor_type is not recognized
         """
-        vendor_type = vendor_type.lower()
+        return VendorInventory._cached_inventory(vendor_type.lower())
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _cached_inventory(vendor_type):
+        """Build a vendor's inventory once; catalogs come from static tables"""
         if vendor_type == "armorer":
             return VendorInventory.get_armorer_inventory()
         elif vendor_type == "merchant":
@@ -121,7 +127,8 @@ class VendorInventory:
             item_name (str): Name of the item
 
         Returns:
-            dict: Item details or None if not found
+            dict: Item details (shared with the cached inventory; don't mutate)
+                or None if not found
         """
         vendor_type = vendor_type.lower()
         inventory = VendorInventory.get_vendor_inventory(vendor_type)
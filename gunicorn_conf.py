@@ -0,0 +1,46 @@
+"""
+Gunicorn configuration for RPG Hex Grid Game
+
+Usage:
+    gunicorn api.game_server:app -c gunicorn_conf.py
+"""
+
+import os
+
+# Imported under another name: gunicorn treats every module-level name here
+# as a setting, and 'config' is one of them
+from config import config as app_config
+
+# Set GUNICORN_BIND=unix:/run/rpg-game.sock to sit behind a local reverse proxy
+bind = os.getenv('GUNICORN_BIND', f"{app_config.HOST}:{app_config.PORT}")
+
+# Game state lives in the process (one GameManager per worker), so a single
+# worker is the default. Threads within that worker share the state, and
+# GameManager.lock serializes access to it.
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# Only used by async worker classes (gevent, eventlet)
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+
+# Load the app before forking so workers share the imported modules and tables.
+# The GameManager itself is created per worker in post_worker_init below.
+preload_app = True
+
+timeout = 30
+keepalive = 5
+
+accesslog = '-'
+loglevel = app_config.LOG_LEVEL.lower()
+
+
+def post_worker_init(worker):
+    """
+    Create the worker's game manager up front instead of on its first request.
+
+    This runs after async workers have monkey-patched the standard library,
+    so GameManager.lock is a greenlet-aware lock under gevent.
+    """
+    from api.game_server import get_game_manager
+    get_game_manager()
@@ -58,9 +58,9 @@ def setup_logging():
 
     # Log initialization
     root_logger.info("=" * 70)
-    root_logger.info(f"{config.APP_NAME} - Logging initialized")
-    root_logger.info(f"Log Level: {config.LOG_LEVEL}")
-    root_logger.info(f"Log File: {log_file_path}")
+    root_logger.info("%s - Logging initialized", config.APP_NAME)
+    root_logger.info("Log Level: %s", config.LOG_LEVEL)
+    root_logger.info("Log File: %s", log_file_path)
     root_logger.info("=" * 70)
 
     return root_logger
@@ -32,8 +32,8 @@ if __name__ == '__main__':
     print("=" * 70)
     print()
 
-    logger.info(f"Starting {config.APP_NAME}")
-    logger.info(f"Environment: {config.FLASK_ENV}, Debug: {config.FLASK_DEBUG}")
+    logger.info("Starting %s", config.APP_NAME)
+    logger.info("Environment: %s, Debug: %s", config.FLASK_ENV, config.FLASK_DEBUG)
 
     try:
         run_server()
@@ -206,6 +206,34 @@ class GameState:
         )
 
 
+# Saves are written with a single call through a buffer this large
+WRITE_BUFFER_SIZE = 1 << 16
+
+
+def write_json(filepath, data):
+    """
+    Write data as indented JSON, replacing the file atomically.
+
+    The document is serialized up front and written in one call to a
+    temporary file next to the target, which then replaces it; a crash
+    mid-write never leaves a truncated save behind.
+
+    Args:
+        filepath (str): Destination path
+        data: JSON-serializable object
+    """
+    payload = json.dumps(data, indent=2).encode('utf-8')
+    tmp_path = filepath + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def save_game(game_state, filename=None, save_dir="saves"):
     """
     Save game state to JSON file.
@@ -233,8 +261,7 @@ def save_game(game_state, filename=None, save_dir="saves"):
     filepath = os.path.join(save_dir, filename)
 
     # Save to JSON
-    with open(filepath, 'w') as f:
-        json.dump(game_state.to_dict(), f, indent=2)
+    write_json(filepath, game_state.to_dict())
 
     return filepath
 
@@ -274,53 +301,73 @@ def load_game(filename, save_dir="saves"):
     return GameState.from_dict(data)
 
 
-def list_saves(save_dir="saves"):
+def iter_saves(save_dir="saves"):
     """
-    List all available save files.
+    Iterate over save file information, newest first.
+
+    Files are ordered by modification time up front (a cheap stat per
+    entry), then opened and summarized one at a time as the caller
+    consumes them.
 
     Args:
         save_dir (str): Directory containing save files
 
-    Returns:
-        list[dict]: List of save file information
+    Yields:
+        dict: Save file information
     """
     if not os.path.exists(save_dir):
-        return []
-
-    saves = []
-    for filename in os.listdir(save_dir):
-        if filename.endswith('.json'):
-            filepath = os.path.join(save_dir, filename)
-            stat = os.stat(filepath)
-
-            # Try to read timestamp from file
-            try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    timestamp = data.get("timestamp", "Unknown")
-                    player_pos = data.get("hex_grid", {}).get("player_position", (0, 0))
-                    num_hexes = len(data.get("hex_grid", {}).get("hexes", {}))
-                    num_quests = len(data.get("quests", []))
-            except Exception:
-                timestamp = "Unknown"
-                player_pos = None
-                num_hexes = 0
-                num_quests = 0
-
-            saves.append({
-                "filename": filename,
-                "filepath": filepath,
-                "timestamp": timestamp,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "size": stat.st_size,
-                "player_position": player_pos,
-                "num_hexes": num_hexes,
-                "num_quests": num_quests
-            })
+        return
+
+    with os.scandir(save_dir) as it:
+        entries = [
+            (entry, entry.stat())
+            for entry in it
+            if entry.name.endswith('.json')
+        ]
 
     # Sort by modification time (newest first)
-    saves.sort(key=lambda x: x["modified"], reverse=True)
-    return saves
+    entries.sort(key=lambda pair: pair[1].st_mtime, reverse=True)
+
+    for entry, stat in entries:
+        filepath = os.path.join(save_dir, entry.name)
+
+        # Try to read timestamp from file
+        try:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+                timestamp = data.get("timestamp", "Unknown")
+                player_pos = data.get("hex_grid", {}).get("player_position", (0, 0))
+                num_hexes = len(data.get("hex_grid", {}).get("hexes", {}))
+                num_quests = len(data.get("quests", []))
+        except Exception:
+            timestamp = "Unknown"
+            player_pos = None
+            num_hexes = 0
+            num_quests = 0
+
+        yield {
+            "filename": entry.name,
+            "filepath": filepath,
+            "timestamp": timestamp,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "size": stat.st_size,
+            "player_position": player_pos,
+            "num_hexes": num_hexes,
+            "num_quests": num_quests
+        }
+
+
+def list_saves(save_dir="saves"):
+    """
+    List all available save files.
+
+    Args:
+        save_dir (str): Directory containing save files
+
+    Returns:
+        list[dict]: List of save file information (newest first)
+    """
+    return list(iter_saves(save_dir))
 
 
 def delete_save(filename, save_dir="saves"):
@@ -6,6 +6,8 @@
 class GameClient {
     constructor(baseUrl = '/api') {
         this.baseUrl = baseUrl;
+        // Last full /dungeon/room response, replayed while the server says it is unchanged
+        this.currentRoom = null;
     }
 
     /**
@@ -136,10 +138,17 @@ class GameClient {
     }
 
     /**
-     * Get current room
+     * Get current room (the last response is reused while its revision is current)
      */
     async getCurrentRoom() {
-        return await this.request('/dungeon/room');
+        const since = this.currentRoom ? `?since=${encodeURIComponent(this.currentRoom.revision)}` : '';
+        const response = await this.request(`/dungeon/room${since}`);
+        if (response.unchanged) {
+            // Combat, if any, was started by the response being replayed
+            return {...this.currentRoom, combat_started: false};
+        }
+        this.currentRoom = response;
+        return response;
     }
 
     /**
@@ -1,6 +1,9 @@
 """
 Single Sheet Overland Game System - Reference Tables
 All tables extracted from the Overland PDF for programmatic access
+
+Tables are read-only: table_roller remembers which dice each dict table is
+rolled with, so changing a table's keys in place would keep the old dice.
 """
 
 # Import table roller utilities for convenience
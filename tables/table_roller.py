@@ -6,6 +6,53 @@ Provides functions to roll on any d6, d66, 2d6, or list-based table
 import random
 
 
+# Dice roller chosen for each dict table, keyed by id(table) as (table, roller).
+# Holding the table keeps its id from being reused while the entry exists.
+# Tables must not be modified after their first roll (see dungeon_tables and
+# overland_tables); build a new dict instead of changing a table's keys.
+_table_dice = {}
+_MAX_CACHED_TABLES = 256
+
+
+def _dice_for_table(table):
+    """
+    Work out which dice a dict table is rolled with from its keys.
+
+    The answer is remembered per table, so tables are treated as read-only.
+
+    Args:
+        table (dict): Non-empty table to roll on
+
+    Returns:
+        callable: Dice roller for the table, or None if its keys match no dice
+    """
+    entry = _table_dice.get(id(table))
+    if entry is not None and entry[0] is table:
+        return entry[1]
+
+    # Check if it's a d6 table (keys 1-6) or a grid table (keys like 11-66)
+    keys = table.keys()
+    if all(isinstance(k, int) and 1 <= k <= 6 for k in keys):
+        # Standard d6 table
+        roller = roll_d6
+    elif all(isinstance(k, int) and 11 <= k <= 66 for k in keys):
+        # Grid table (d66) - roll two d6 and combine
+        roller = roll_d66
+    elif all(isinstance(k, int) and 2 <= k <= 12 for k in keys):
+        # 2d6 table
+        roller = roll_2d6
+    elif all(isinstance(k, int) and 1 <= k <= 4 for k in keys):
+        # d4 table
+        roller = roll_d4
+    else:
+        roller = None
+
+    if len(_table_dice) >= _MAX_CACHED_TABLES:
+        _table_dice.clear()
+    _table_dice[id(table)] = (table, roller)
+    return roller
+
+
 def roll_on_table(table, table_name=None):
     """
     Roll on a table and return a random result.
@@ -37,28 +84,15 @@ def roll_on_table(table, table_name=None):
 
     # Handle different table types
     if isinstance(table, dict):
-        # Check if it's a d6 table (keys 1-6) or a grid table (keys like 11-66)
-        keys = list(table.keys())
-
-        if not keys:
+        if not table:
             raise ValueError(f"Table{name_str} is empty")
 
-        # Determine what kind of dice to roll based on the keys
-        if all(isinstance(k, int) and 1 <= k <= 6 for k in keys):
-            # Standard d6 table
-            roll = roll_d6()
-        elif all(isinstance(k, int) and 11 <= k <= 66 for k in keys):
-            # Grid table (d66) - roll two d6 and combine
-            roll = roll_d66()
-        elif all(isinstance(k, int) and 2 <= k <= 12 for k in keys):
-            # 2d6 table
-            roll = roll_2d6()
-        elif all(isinstance(k, int) and 1 <= k <= 4 for k in keys):
-            # d4 table
-            roll = roll_d4()
-        else:
+        roll_dice_for_table = _dice_for_table(table)
+        if roll_dice_for_table is None:
             # Unknown table format, just pick a random key
-            roll = random.choice(keys)
+            roll = random.choice(list(table.keys()))
+        else:
+            roll = roll_dice_for_table()
 
         return table.get(roll)
 
@@ -0,0 +1,53 @@
+"""
+Unit tests for dungeon_generator module
+"""
+
+import unittest
+from generators.dungeon_generator import DungeonRoom
+from generators.monster import Monster
+
+
+class TestDungeonRoom(unittest.TestCase):
+    """Test cases for DungeonRoom class"""
+
+    def setUp(self):
+        self.room = DungeonRoom(1, 2, room_type="corridor")
+
+    def test_to_dict_reused_while_unchanged(self):
+        """Test a room without monsters reuses its dictionary"""
+        room_dict = self.room.to_dict()
+        self.assertEqual(room_dict["x"], 1)
+        self.assertEqual(room_dict["room_type"], "corridor")
+        self.assertIs(self.room.to_dict(), room_dict)
+
+    def test_to_dict_follows_reassigned_fields(self):
+        """Test reassigning a field discards the cached dictionary"""
+        room_dict = self.room.to_dict()
+        self.room.explore()
+        self.assertTrue(self.room.to_dict()["explored"])
+
+        self.room.treasure = ["Silver chalice"]
+        self.assertEqual(self.room.to_dict()["treasure"], ["Silver chalice"])
+        self.assertFalse(room_dict["explored"])
+
+    def test_to_dict_shows_in_place_changes(self):
+        """Test in-place changes to the room's lists show in the cached dictionary"""
+        room_dict = self.room.to_dict()
+        self.room.add_exit("north")
+        self.assertIn("north", self.room.to_dict()["exits"])
+        self.assertIs(self.room.to_dict(), room_dict)
+
+    def test_to_dict_rebuilt_while_monsters_present(self):
+        """Test rooms with monsters convert them on every call"""
+        monster = Monster("Goblin", "1", 12, "1d6")
+        self.room.monsters = [monster]
+        room_dict = self.room.to_dict()
+        self.assertEqual(room_dict["monsters"][0]["name"], "Goblin")
+
+        monster.take_damage(monster.hp_max)
+        self.assertIsNot(self.room.to_dict(), room_dict)
+        self.assertFalse(self.room.to_dict()["monsters"][0]["is_alive"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit tests for the game server's cached and conditional responses
+"""
+
+import gzip
+import random
+import unittest
+
+from api.game_server import app, get_game_manager, limiter
+from api.game_state import GameManager
+from generators.dungeon_generator import Dungeon
+from generators.monster import Monster
+
+# Seed whose first move east explores its hex without errors or combat
+SEED = 1
+
+
+class ServerTestCase(unittest.TestCase):
+    """Runs each test against a new game with rate limiting off"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.limiter_enabled = limiter.enabled
+        limiter.enabled = False
+
+    @classmethod
+    def tearDownClass(cls):
+        limiter.enabled = cls.limiter_enabled
+
+    def setUp(self):
+        random.seed(SEED)
+        self.client = app.test_client()
+        self.client.post('/api/game/new')
+        self.client.post('/api/character/random', json={})
+        self.manager = get_game_manager()
+
+    def other_epoch_revision(self):
+        """Revision a restarted server would use for the current version"""
+        other = GameManager(self.manager.game_state)
+        return f"{other.revision_epoch}-{self.manager.state_version}"
+
+
+class TestStateEndpoint(ServerTestCase):
+    """Test cases for GET /api/game/state"""
+
+    def get_state(self, query=''):
+        response = self.client.get('/api/game/state' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def move_east(self):
+        q, r = self.manager.game_state.hex_grid.player_position
+        response = self.client.post('/api/player/move', json={'q': q + 1, 'r': r})
+        self.assertEqual(response.status_code, 200)
+        return q + 1, r
+
+    def test_since_current_revision_is_unchanged(self):
+        """Test a client holding the current revision gets a short body"""
+        revision = self.get_state()['state']['hex_grid']['revision']
+        body = self.get_state(f'?since={revision}')
+        self.assertEqual(body, {"success": True, "unchanged": True, "revision": revision})
+
+    def test_since_stale_revision_returns_changed_hexes(self):
+        """Test a client holding an older revision gets only the changed hexes"""
+        full = self.get_state()['state']
+        revision = full['hex_grid']['revision']
+        position = self.move_east()
+
+        hex_grid = self.get_state(f'?since={revision}')['state']['hex_grid']
+        self.assertEqual(hex_grid['since'], revision)
+        self.assertEqual(hex_grid['revision'], self.manager.revision)
+        changed = {(h['q'], h['r']): h for h in hex_grid['hexes']}
+        self.assertTrue(changed[position]['explored'])
+        self.assertLess(len(changed), len(self.get_state()['state']['hex_grid']['hexes']))
+
+    def test_since_from_before_restart_gets_full_state(self):
+        """Test a revision from another server process is answered in full"""
+        body = self.get_state(f'?since={self.other_epoch_revision()}')
+        self.assertNotIn('unchanged', body)
+        self.assertNotIn('since', body['state']['hex_grid'])
+        self.assertEqual(len(body['state']['hex_grid']['hexes']),
+                         len(self.manager.game_state.hex_grid.hexes))
+
+    def test_etag_not_modified(self):
+        """Test a matching If-None-Match gets an empty 304 until the state changes"""
+        response = self.client.get('/api/game/state')
+        etag = response.headers['ETag']
+
+        response = self.client.get('/api/game/state', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        self.move_east()
+        response = self.client.get('/api/game/state', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_state_body_is_compressed(self):
+        """Test the state body is compressed for clients that accept gzip"""
+        response = self.client.get('/api/game/state', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers.get('Content-Encoding'), 'gzip')
+
+    def test_large_state_body_is_compressed(self):
+        """Test a state body of several hundred KB is compressed as well"""
+        with self.manager.lock:
+            grid = self.manager.game_state.hex_grid
+            for q in range(40):
+                for r in range(20):
+                    grid.reveal_hex(q, r)
+            self.manager.state_version += 1
+        response = self.client.get('/api/game/state', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers.get('Content-Encoding'), 'gzip')
+        self.assertGreater(len(gzip.decompress(response.data)), 1 << 16)
+
+
+class TestDungeonRoomEndpoint(ServerTestCase):
+    """Test cases for GET /api/dungeon/room"""
+
+    def setUp(self):
+        super().setUp()
+        with self.manager.lock:
+            self.manager.generate_quest()
+            self.manager.accept_quest(0)
+            dungeon = self.manager.game_state.active_quest.dungeon = Dungeon()
+            dungeon.enter()
+
+    def get_room(self, query=''):
+        response = self.client.get('/api/dungeon/room' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()
+
+    def test_since_current_revision_is_unchanged(self):
+        """Test a client whose room is current gets a short body"""
+        revision = self.get_room()['revision']
+        body = self.get_room(f'?since={revision}')
+        self.assertEqual(body, {"success": True, "unchanged": True, "revision": revision})
+
+    def test_repeated_polls_keep_revision(self):
+        """Test looking at a quiet room again does not move its revision on"""
+        revision = self.get_room()['revision']
+        self.assertEqual(self.get_room()['revision'], revision)
+        body = self.get_room(f'?since={revision}')
+        self.assertTrue(body['unchanged'])
+
+    def test_starting_combat_moves_revision_on(self):
+        """Test a room whose monsters start combat is sent again"""
+        revision = self.get_room()['revision']
+        with self.manager.lock:
+            room = self.manager.game_state.active_quest.dungeon.grid.get_current_room()
+            room.monsters = [Monster("Goblin", "1", 12, "1d6")]
+            self.manager.state_version += 1
+
+        body = self.get_room(f'?since={revision}')
+        self.assertTrue(body['combat_started'])
+        self.assertNotEqual(body['revision'], revision)
+
+    def test_since_stale_revision_returns_room(self):
+        """Test a client holding an older revision gets the room again"""
+        revision = self.get_room()['revision']
+        self.client.post('/api/character/random', json={})
+
+        body = self.get_room(f'?since={revision}')
+        self.assertIn('room', body)
+        self.assertNotEqual(body['revision'], revision)
+
+    def test_since_from_before_restart_returns_room(self):
+        """Test a revision from another server process is not taken as current"""
+        self.get_room()
+        body = self.get_room(f'?since={self.other_epoch_revision()}')
+        self.assertIn('room', body)
+        self.assertEqual(body['revision'], self.manager.revision)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,294 @@
+"""
+Unit tests for the GameManager's cached state payloads
+"""
+
+import copy
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from api.game_state import GameManager
+from api.json_provider import dumps_bytes
+from generators.dungeon_generator import Dungeon
+from generators.monster import Monster
+from generators.vendor import VendorInventory
+from save_load import GameState
+
+# Seed for the scripted playthroughs, picked so they never reach a monster's
+# combat turn or an Unnatural danger, both of which still raise AttributeError
+SEED = 81
+STEPS = [(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)]
+
+
+def comparable(state):
+    """Round-trip a get_state payload through JSON, leaving out its revision"""
+    state = json.loads(dumps_bytes(state))
+    del state["hex_grid"]["revision"]
+    return state
+
+
+def cold_state(manager):
+    """Build get_state for a copy of the manager's game that has no caches"""
+    game_state = GameState.from_dict(copy.deepcopy(manager.game_state.to_dict()))
+    return comparable(GameManager(game_state).get_state())
+
+
+def play(manager, steps):
+    """Move the player around at random, fleeing any combat that starts"""
+    fights = 0
+    for _ in range(steps):
+        q, r = manager.game_state.hex_grid.player_position
+        dq, dr = random.choice(STEPS)
+        try:
+            manager.move_player(q + dq, r + dr)
+        except ValueError:
+            pass
+        while manager.game_state.active_combat:
+            fights += 1
+            manager.combat_flee()
+    return fights
+
+
+class TestStateCache(unittest.TestCase):
+    """Test cases for the per-version get_state caches"""
+
+    def setUp(self):
+        random.seed(SEED)
+        self.manager = GameManager()
+        self.manager.generate_random_character()
+
+    def assertMatchesColdRebuild(self):
+        expected = cold_state(self.manager)
+        self.assertEqual(comparable(self.manager.get_state()), expected)
+        state_bytes = json.loads(self.manager.get_state_bytes())
+        del state_bytes["hex_grid"]["revision"]
+        self.assertEqual(state_bytes, expected)
+
+    def test_state_matches_cold_rebuild_after_moves_and_combat(self):
+        """Test cached payloads equal a rebuild from scratch as play goes on"""
+        fights = 0
+        for _ in range(12):
+            fights += play(self.manager, 2)
+            self.assertMatchesColdRebuild()
+        self.assertGreater(fights, 0)
+
+    def test_state_bytes_equal_serialized_state(self):
+        """Test get_state_bytes is get_state serialized"""
+        play(self.manager, 6)
+        self.assertEqual(self.manager.get_state_bytes(), dumps_bytes(self.manager.get_state()))
+
+    def test_state_matches_cold_rebuild_after_load(self):
+        """Test loading a save replaces everything the caches were built from"""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                self.manager.save("cache_test")
+                saved = cold_state(self.manager)
+                play(self.manager, 8)
+                self.manager.get_state_bytes()
+                self.manager.load("cache_test")
+            finally:
+                os.chdir(cwd)
+        self.assertMatchesColdRebuild()
+        self.assertEqual(comparable(self.manager.get_state()), saved)
+
+    def test_state_reused_while_version_unchanged(self):
+        """Test reads between writes share one payload"""
+        self.assertIs(self.manager.get_state(), self.manager.get_state())
+        self.assertIs(self.manager.get_state_bytes(), self.manager.get_state_bytes())
+
+
+class TestStateDelta(unittest.TestCase):
+    """Test cases for get_state(since_revision=...)"""
+
+    def setUp(self):
+        random.seed(SEED)
+        self.manager = GameManager()
+        self.manager.generate_random_character()
+
+    def test_delta_applied_to_old_state_equals_new_state(self):
+        """Test merging a delta into an older full state gives the new full state"""
+        old = comparable(self.manager.get_state())
+        revision = self.manager.get_state()["hex_grid"]["revision"]
+        play(self.manager, 10)
+
+        delta = self.manager.get_state(since_revision=revision)
+        self.assertEqual(delta["hex_grid"]["since"], revision)
+        delta = comparable(delta)
+        del delta["hex_grid"]["since"]
+        new = comparable(self.manager.get_state())
+        self.assertLess(len(delta["hex_grid"]["hexes"]), len(new["hex_grid"]["hexes"]))
+
+        hexes = {(h["q"], h["r"]): h for h in old["hex_grid"]["hexes"]}
+        hexes.update(((h["q"], h["r"]), h) for h in delta["hex_grid"]["hexes"])
+        self.assertEqual(sorted(hexes.values(), key=lambda h: (h["q"], h["r"])),
+                         sorted(new["hex_grid"]["hexes"], key=lambda h: (h["q"], h["r"])))
+        visible = [h for h in hexes.values() if h["revealed"] or h["explored"]]
+        self.assertEqual(sorted(visible, key=lambda h: (h["q"], h["r"])),
+                         sorted(new["hex_grid"]["visible_hexes"], key=lambda h: (h["q"], h["r"])))
+
+        for key in new:
+            if key != "hex_grid":
+                self.assertEqual(delta[key], new[key], key)
+        self.assertEqual(delta["hex_grid"]["player_position"], new["hex_grid"]["player_position"])
+
+    def test_revision_from_another_manager_gets_full_state(self):
+        """Test a revision with another epoch is not treated as a base for a delta"""
+        other = GameManager(copy.deepcopy(self.manager.game_state))
+        revision = other.get_state()["hex_grid"]["revision"]
+        self.assertNotEqual(revision, self.manager.revision)
+
+        state = self.manager.get_state(since_revision=revision)
+        self.assertNotIn("since", state["hex_grid"])
+        self.assertIs(state, self.manager.get_state())
+
+    def test_malformed_revision_gets_full_state(self):
+        """Test revisions that can't be parsed get the full state"""
+        for revision in ("", "garbage", f"{self.manager.revision_epoch}-x", 3):
+            state = self.manager.get_state(since_revision=revision)
+            self.assertNotIn("since", state["hex_grid"])
+
+    def test_revision_before_new_game_gets_full_state(self):
+        """Test a revision from before the grid was replaced gets the full state"""
+        revision = self.manager.revision
+        self.manager.new_game()
+        state = self.manager.get_state(since_revision=revision)
+        self.assertNotIn("since", state["hex_grid"])
+
+
+class TestHexFormatCache(unittest.TestCase):
+    """Test cases for the per-hex client format cache"""
+
+    def setUp(self):
+        random.seed(SEED)
+        self.manager = GameManager()
+        self.grid = self.manager.game_state.hex_grid
+
+    def unexplored_hex(self):
+        return next(h for h in self.grid.get_visible_hexes() if not h.explored)
+
+    def test_unchanged_hex_reuses_format(self):
+        """Test an unchanged hex is formatted once"""
+        hex_obj = self.unexplored_hex()
+        data = self.manager._hex_to_client_format(hex_obj, None)
+        self.assertIs(self.manager._hex_to_client_format(hex_obj, None), data)
+        self.assertIs(self.manager._hex_to_client_bytes(hex_obj, None),
+                      self.manager._hex_to_client_bytes(hex_obj, None))
+
+    def test_changed_hex_is_reformatted(self):
+        """Test revealing a hex again or moving the dungeon rebuilds its format"""
+        hex_obj = self.unexplored_hex()
+        data = self.manager._hex_to_client_format(hex_obj, None)
+
+        hex_obj.reveal()
+        revealed = self.manager._hex_to_client_format(hex_obj, None)
+        self.assertIsNot(revealed, data)
+        self.assertEqual(revealed, data)
+
+        with_dungeon = self.manager._hex_to_client_format(hex_obj, hex_obj.coordinates)
+        self.assertTrue(with_dungeon["has_dungeon"])
+        self.assertEqual(json.loads(self.manager._hex_to_client_bytes(hex_obj, hex_obj.coordinates)),
+                         with_dungeon)
+
+    def test_dungeon_flag_follows_active_quest(self):
+        """Test a hex's has_dungeon flag changes once its quest has a dungeon"""
+        self.manager.generate_random_character()
+        self.manager.generate_quest()
+        self.manager.accept_quest(0)
+        quest = self.manager.game_state.active_quest
+        coords = tuple(quest.coordinates)
+
+        def flag():
+            hexes = self.manager.get_state()["hex_grid"]["hexes"]
+            return next(h["has_dungeon"] for h in hexes if (h["q"], h["r"]) == coords)
+
+        self.assertFalse(flag())
+        quest.dungeon = Dungeon()
+        self.manager.state_version += 1
+        self.assertTrue(flag())
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for snapshot() and from_snapshot()"""
+
+    def test_from_snapshot_plays_on_from_a_copy(self):
+        """Test a restored manager has its own copy of the state and its own caches"""
+        random.seed(SEED)
+        manager = GameManager()
+        manager.generate_random_character()
+        snapshot = manager.snapshot()
+
+        with mock.patch("api.game_state.GameState", side_effect=AssertionError("new world rolled")):
+            restored = GameManager.from_snapshot(snapshot)
+        self.assertIsNot(restored.game_state, snapshot)
+        self.assertEqual(comparable(restored.get_state()), comparable(manager.get_state()))
+        self.assertNotEqual(restored.revision_epoch, manager.revision_epoch)
+        with restored.lock:
+            play(restored, 4)
+        self.assertEqual(comparable(manager.get_state()), cold_state(manager))
+
+
+class TestCurrentRoom(unittest.TestCase):
+    """Test cases for when get_current_room bumps the state version"""
+
+    def setUp(self):
+        random.seed(SEED)
+        self.manager = GameManager()
+        self.manager.generate_random_character()
+        self.manager.generate_quest()
+        self.manager.accept_quest(0)
+        self.dungeon = self.manager.game_state.active_quest.dungeon = Dungeon()
+        self.dungeon.enter()
+
+    def test_viewing_quiet_room_keeps_version(self):
+        """Test looking at a room without monsters leaves caches in place"""
+        revision = self.manager.get_current_room()["revision"]
+        state = self.manager.get_state()
+        self.assertEqual(self.manager.get_current_room()["revision"], revision)
+        self.assertIs(self.manager.get_state(), state)
+
+    def test_starting_combat_bumps_version(self):
+        """Test looking at a room that starts combat moves the revision on"""
+        revision = self.manager.revision
+        self.dungeon.grid.get_current_room().monsters = [Monster("Goblin", "1", 12, "1d6")]
+        room = self.manager.get_current_room()
+        self.assertTrue(room["combat_started"])
+        self.assertNotEqual(room["revision"], revision)
+        self.assertFalse(self.manager.get_current_room()["combat_started"])
+        self.assertEqual(self.manager.revision, room["revision"])
+
+    def test_fallback_room_bumps_version(self):
+        """Test a dungeon without a grid records a new room on every look"""
+        self.dungeon.grid = None
+        revision = self.manager.revision
+        room = self.manager.get_current_room()
+        self.assertNotEqual(room["revision"], revision)
+        self.assertEqual(len(self.dungeon.explored_rooms), 1)
+
+
+class TestPurchaseItem(unittest.TestCase):
+    """Test cases for buying from a settlement's vendors"""
+
+    def test_response_item_is_a_copy(self):
+        """Test changing a purchase's item leaves the vendor's catalog alone"""
+        random.seed(SEED)
+        manager = GameManager()
+        manager.generate_random_character()
+        settlement = manager.game_state.hex_grid.get_current_hex()
+        settlement.is_settlement = True
+        settlement.available_vendors = ["Merchant"]
+        manager.game_state.party_gold = 100
+
+        item_name = VendorInventory.get_vendor_inventory("Merchant")[0]["name"]
+        catalog_entry = dict(VendorInventory.get_item_details("Merchant", item_name))
+        result = manager.purchase_item("Merchant", item_name)
+        result["item"]["cost_silver"] = 0
+        self.assertEqual(VendorInventory.get_item_details("Merchant", item_name), catalog_entry)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -258,6 +258,20 @@ class TestHexGrid(unittest.TestCase):
         visible = grid.get_visible_hexes()
         self.assertEqual(len(visible), 3)
 
+    def test_get_visible_hexes_reused_until_visibility_changes(self):
+        """Test the visible hex list is rebuilt only when a hex is added or revealed"""
+        grid = HexGrid()
+        visible = grid.get_visible_hexes()
+        self.assertIs(grid.get_visible_hexes(), visible)
+
+        grid.get_or_create_hex(3, 3)
+        self.assertEqual(grid.get_visible_hexes(), visible)
+
+        revealed = grid.reveal_hex(1, 1)
+        visible = grid.get_visible_hexes()
+        self.assertIn(revealed, visible)
+        self.assertIs(grid.get_visible_hexes(), visible)
+
     def test_get_hex_info(self):
         """Test getting hex info for UI"""
         grid = HexGrid()
@@ -58,6 +58,19 @@ class TestQuestClass(unittest.TestCase):
         self.assertEqual(quest_dict["action"], "Locate")
         self.assertEqual(quest_dict["target"], "Treasure")
 
+    def test_quest_to_dict_follows_reassigned_fields(self):
+        """Test reassigning a field discards the cached dictionary"""
+        quest_dict = self.quest.to_dict()
+        quest_dict["reward"] = "Nothing"
+        self.assertEqual(self.quest.to_dict()["reward"], "Gold")
+
+        self.quest.reward = "Land"
+        self.quest.coordinates = (2, -1)
+        quest_dict = self.quest.to_dict()
+        self.assertEqual(quest_dict["reward"], "Land")
+        self.assertIn("land", quest_dict["description"])
+        self.assertEqual(quest_dict["coordinates"], (2, -1))
+
     def test_quest_formatted_display(self):
         """Test quest formatted display"""
         display = self.quest.formatted_display()
@@ -0,0 +1,120 @@
+"""
+Unit tests for save_load module
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from generators.character import generate_random_character, load_character, save_character
+from save_load import GameState, iter_saves, list_saves, save_game, write_json
+
+
+class TestSaveListing(unittest.TestCase):
+    """Test cases for iter_saves and list_saves"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.save_dir = tmp.name
+
+    def write_save(self, filename, mtime, text=None):
+        """Write a save (or raw text) and give it a fixed modification time"""
+        filepath = os.path.join(self.save_dir, filename)
+        if text is None:
+            save_game(GameState(), filename, save_dir=self.save_dir)
+        else:
+            with open(filepath, 'w') as f:
+                f.write(text)
+        os.utime(filepath, (mtime, mtime))
+
+    def test_newest_first(self):
+        """Test saves are listed by modification time, newest first"""
+        self.write_save("old.json", 1000)
+        self.write_save("new.json", 3000)
+        self.write_save("middle.json", 2000)
+        names = [save["filename"] for save in iter_saves(self.save_dir)]
+        self.assertEqual(names, ["new.json", "middle.json", "old.json"])
+
+    def test_corrupt_save_summarized_as_unknown(self):
+        """Test a file that is not valid JSON is still listed"""
+        self.write_save("good.json", 2000)
+        self.write_save("corrupt.json", 1000, text="{not json")
+        good, corrupt = iter_saves(self.save_dir)
+
+        self.assertNotEqual(good["timestamp"], "Unknown")
+        self.assertEqual(corrupt["filename"], "corrupt.json")
+        self.assertEqual(corrupt["timestamp"], "Unknown")
+        self.assertIsNone(corrupt["player_position"])
+        self.assertEqual(corrupt["num_hexes"], 0)
+        self.assertEqual(corrupt["size"], len("{not json"))
+
+    def test_list_saves_matches_iter_saves(self):
+        """Test list_saves returns the same entries, skipping other files"""
+        self.write_save("first.json", 1000)
+        self.write_save("second.json", 2000)
+        self.write_save("notes.txt", 3000, text="not a save")
+        saves = list_saves(self.save_dir)
+        self.assertEqual(saves, list(iter_saves(self.save_dir)))
+        self.assertEqual([save["filename"] for save in saves], ["second.json", "first.json"])
+
+    def test_missing_directory_lists_nothing(self):
+        """Test a save directory that does not exist yet gives an empty list"""
+        self.assertEqual(list_saves(os.path.join(self.save_dir, "missing")), [])
+
+
+class TestWriteJson(unittest.TestCase):
+    """Test cases for write_json and the saves written through it"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+        self.filepath = os.path.join(self.tmp_dir, "save.json")
+
+    def read(self):
+        with open(self.filepath) as f:
+            return json.load(f)
+
+    def test_writes_json_without_leftovers(self):
+        """Test the file is replaced and no .tmp file is left behind"""
+        write_json(self.filepath, {"version": 1})
+        write_json(self.filepath, {"version": 2})
+        self.assertEqual(self.read(), {"version": 2})
+        self.assertEqual(os.listdir(self.tmp_dir), ["save.json"])
+
+    def test_serialization_error_keeps_old_file(self):
+        """Test a document that cannot be serialized leaves the old save intact"""
+        write_json(self.filepath, {"version": 1})
+        with self.assertRaises(TypeError):
+            write_json(self.filepath, {"version": 2, "bad": object()})
+        self.assertEqual(self.read(), {"version": 1})
+        self.assertEqual(os.listdir(self.tmp_dir), ["save.json"])
+
+    def test_failed_replace_removes_temporary_file(self):
+        """Test an error after the temporary file is written cleans it up"""
+        write_json(self.filepath, {"version": 1})
+        with mock.patch("save_load.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_json(self.filepath, {"version": 2})
+        self.assertEqual(self.read(), {"version": 1})
+        self.assertEqual(os.listdir(self.tmp_dir), ["save.json"])
+
+    def test_character_round_trip(self):
+        """Test save_character still loads back through load_character"""
+        player = generate_random_character("Test Hero")
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        try:
+            filepath = save_character(player, "hero.json")
+            loaded = load_character("hero.json")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(loaded.to_dict(), player.to_dict())
+        self.assertEqual(os.listdir(os.path.dirname(filepath)), ["hero.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
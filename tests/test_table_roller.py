@@ -5,6 +5,7 @@ Unit tests for table_roller module
 import os
 import sys
 import unittest
+from tables import table_roller
 from tables.table_roller import (
     roll_on_table,
     roll_on_table_by_name,
@@ -198,6 +199,49 @@ class TestRollOnTable(unittest.TestCase):
             roll_on_table(42)
 
 
+class TestTableDiceCache(unittest.TestCase):
+    """Test the per-table cache of which dice a dict table is rolled with"""
+
+    def setUp(self):
+        table_roller._table_dice.clear()
+        self.addCleanup(table_roller._table_dice.clear)
+
+    def assertRollsTwice(self, table, roller):
+        """Roll twice through the cache, checking the dice it remembers"""
+        for _ in range(2):
+            self.assertIn(roll_on_table(table), table.values())
+            self.assertIs(table_roller._dice_for_table(table), roller)
+        self.assertEqual(table_roller._table_dice[id(table)], (table, roller))
+
+    def test_d6_table(self):
+        """Test a d6 table is remembered as rolled with a d6"""
+        self.assertRollsTwice({k: f"Item {k}" for k in range(1, 7)}, roll_d6)
+
+    def test_d66_table(self):
+        """Test a d66 table is remembered as rolled with d66"""
+        table = {tens * 10 + ones: f"Item {tens}{ones}" for tens in range(1, 7) for ones in range(1, 7)}
+        self.assertRollsTwice(table, roll_d66)
+
+    def test_2d6_table(self):
+        """Test a 2d6 table is remembered as rolled with 2d6"""
+        self.assertRollsTwice({k: f"Item {k}" for k in range(2, 13)}, roll_2d6)
+
+    def test_unknown_keys_table(self):
+        """Test a table matching no dice is remembered as such and picks a random key"""
+        self.assertRollsTwice({"a": "Apple", "b": "Banana"}, None)
+
+    def test_cache_cleared_past_limit(self):
+        """Test the cache starts over instead of growing past its limit"""
+        tables = [{"only": i} for i in range(table_roller._MAX_CACHED_TABLES)]
+        for table in tables:
+            roll_on_table(table)
+        self.assertEqual(len(table_roller._table_dice), table_roller._MAX_CACHED_TABLES)
+
+        extra = {"only": "extra"}
+        self.assertEqual(roll_on_table(extra), "extra")
+        self.assertEqual(list(table_roller._table_dice.values()), [(extra, None)])
+
+
 class TestRollOnTableByName(unittest.TestCase):
     """Test rolling on tables by name from a module"""
 